@@ -1,25 +1,47 @@
-
 from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, List, Tuple
+from typing import Dict, Optional, List, Set, Tuple
+import os
 import shutil
+import sys
 import re
 
-CANDIDATE_SUBDIRS = [
-    Path("NG"),
-    Path("OK") / "DL_CANDIDATE",
-    Path("OK") / "DL_OK",
-]
+CANDIDATE_SUBDIRS = (
+    "NG",
+    os.path.join("OK", "DL_CANDIDATE"),
+    os.path.join("OK", "DL_OK"),
+)
+# (subdir, lower-cased top folder) so presence checks need no per-hour parsing
+_CANDIDATE_TOPS = tuple((sub, sub.split(os.sep, 1)[0].lower()) for sub in CANDIDATE_SUBDIRS)
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # private kernel32 handle: argtypes set here don't leak into ctypes.windll users
+    _CopyFileW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    _CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _CopyFileW.restype = wintypes.BOOL
 
-@dataclass
+    def _copy_file(src: str, dst: str) -> None:
+        # Kernel-side copy of data + attributes + timestamps (what copy2 does, minus the Python read/write loop)
+        if not _CopyFileW(src, dst, False):
+            # WinError maps the code to the matching OSError subclass (FileNotFoundError, PermissionError, ...)
+            raise ctypes.WinError(ctypes.get_last_error())
+else:
+    def _copy_file(src: str, dst: str) -> None:
+        # copy2 -> copyfile already uses sendfile()/fcopyfile() here
+        shutil.copy2(src, dst)
+
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     cell_id: str
-    folder: Path
-    category_dir: Path
-    img0: Optional[Path]
-    img1: Optional[Path]
+    folder: str
+    category_dir: str
+    img0: Optional[str]
+    img1: Optional[str]
     timestamp_key: str  # sortable key extracted from folder name (YYYYMMDD_HHMMSS)
 
 def parse_date(date_str: str) -> Tuple[str, str, str]:
@@ -38,28 +60,19 @@ def parse_date(date_str: str) -> Tuple[str, str, str]:
         raise ValueError("Month and Day must be numeric.")
     return yyyy, mm.zfill(2), dd.zfill(2)
 
-def iter_hour_dirs(date_root: Path) -> Iterable[Path]:
-    for h in range(24):
-        yield date_root / f"{h:02d}"
-
-def _safe_listdir(p: Path) -> List[Path]:
-    try:
-        return list(p.iterdir())
-    except Exception:
-        return []
-
-def find_matching_image_folders(search_dir: Path, cell_id: str) -> List[Path]:
+def find_matching_image_folders(search_dir: str, match_cells: CellMatcher) -> List[Tuple[str, List[str]]]:
     """
-    Returns immediate subfolders in search_dir whose name contains _{cell_id}
+    Returns (subfolder, cell_ids) for immediate subfolders in search_dir whose name
+    contains _{cell_id} for any cell (see CellMatcher)
     """
-    if not search_dir.exists() or not search_dir.is_dir():
+    hit = match_cells.search
+    try:
+        with os.scandir(search_dir) as it:
+            # C-level prefilter first; DirEntry.is_dir() uses the type info from the directory read (no extra stat)
+            folders = [e for e in it if hit(e.name) is not None and e.is_dir(follow_symlinks=False)]
+    except OSError:
         return []
-    needle = f"_{cell_id}"
-    matches: List[Path] = []
-    for p in _safe_listdir(search_dir):
-        if p.is_dir() and needle in p.name:
-            matches.append(p)
-    return matches
+    return [(e.path, match_cells(e.name)) for e in folders]
 
 def extract_timestamp_key(folder_name: str) -> str:
     """
@@ -68,64 +81,181 @@ def extract_timestamp_key(folder_name: str) -> str:
     We extract '20260117_152731' as a sortable key.
     If not found, return empty string (least).
     """
-    m = re.match(r"^(\d{8}_\d{6})_", folder_name)
-    return m.group(1) if m else ""
+    # Fixed layout, so plain slicing instead of a regex match per folder.
+    s = folder_name
+    if len(s) > 15 and s[8] == "_" and s[15] == "_" and s[:8].isdecimal() and s[9:15].isdecimal():
+        return s[:15]
+    return ""
 
-def find_required_images(image_folder: Path, cell_id: str) -> Tuple[Optional[Path], Optional[Path]]:
-    pat0 = f"*_{cell_id}_EXT_DL_0_2.jpg"
-    pat1 = f"*_{cell_id}_EXT_DL_1_2.jpg"
-    img0 = next(iter(image_folder.glob(pat0)), None)
-    img1 = next(iter(image_folder.glob(pat1)), None)
-    return img0, img1
+# *_<CELLID>_EXT_DL_0_2.jpg / *_<CELLID>_EXT_DL_1_2.jpg (case-insensitive, as glob() was on Windows)
+_IMG_RE = re.compile(r"_EXT_DL_([01])_2\.jpg$", re.IGNORECASE)
 
-def search_matches_for_cell(base_dir: Path, yyyy: str, mm: str, dd: str, cell_id: str) -> List[MatchResult]:
-    date_root = base_dir / yyyy / mm / dd
-    results: List[MatchResult] = []
-    if not date_root.exists():
-        return results
+def find_required_images(image_folder: str, cell_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Single directory read collecting *_{cell_id}_EXT_DL_0_2.jpg and *_{cell_id}_EXT_DL_1_2.jpg
+    for every cell_id whose name matched image_folder.
+    Returns {cell_id: (img0, img1)}.
+    """
+    needles = [(f"_{cid}".lower(), cid) for cid in cell_ids]
+    found: Dict[str, List[Optional[str]]] = {cid: [None, None] for cid in cell_ids}
+    missing = 2 * len(found)
+    try:
+        with os.scandir(image_folder) as it:
+            for e in it:
+                m = _IMG_RE.search(e.name)
+                if m is None:
+                    continue
+                head = e.name[:m.start()].lower()
+                k = 0 if m.group(1) == "0" else 1
+                for needle, cid in needles:
+                    slot = found[cid]
+                    if slot[k] is None and head.endswith(needle):
+                        slot[k] = e.path
+                        missing -= 1
+                if missing <= 0:
+                    break
+    except OSError:
+        pass
+    return {cid: (v[0], v[1]) for cid, v in found.items()}
+
+def _subdir_names(p: str) -> Set[str]:
+    """Lower-cased names of the subfolders of p (empty if p is missing)."""
+    try:
+        with os.scandir(p) as it:
+            return {e.name.lower() for e in it if e.is_dir()}
+    except OSError:
+        return set()
 
-    for hour_dir in iter_hour_dirs(date_root):
-        if not hour_dir.exists():
+def candidate_dirs(date_root: str) -> List[str]:
+    """
+    Returns <date_root>/HH/<sub> for every existing hour and every existing CANDIDATE_SUBDIRS entry.
+    Presence is taken from one directory read of date_root and of each hour
+    instead of an exists() call per hour and subdir. Computed once per date and run.
+    """
+    hours = _subdir_names(date_root)
+    out: List[str] = []
+    for h in range(24):
+        hour = f"{h:02d}"
+        if hour not in hours:
             continue
-        for sub in CANDIDATE_SUBDIRS:
-            candidate_dir = hour_dir / sub
-            folders = find_matching_image_folders(candidate_dir, cell_id)
-            for f in folders:
-                img0, img1 = find_required_images(f, cell_id)
-                results.append(
-                    MatchResult(
-                        cell_id=cell_id,
-                        folder=f,
-                        category_dir=candidate_dir,
-                        img0=img0,
-                        img1=img1,
-                        timestamp_key=extract_timestamp_key(f.name),
-                    )
+        hour_dir = os.path.join(date_root, hour)
+        present = _subdir_names(hour_dir)
+        for sub, top in _CANDIDATE_TOPS:
+            if top in present:
+                out.append(os.path.join(hour_dir, sub))
+    return out
+
+class CellMatcher:
+    """
+    Finds every cell_id whose _{cell_id} occurs in a folder name, using one compiled
+    alternation regex instead of one substring scan per cell.
+
+    `search` is the bare compiled-regex search (C level, no Python frame), used to
+    reject the many non-matching directory entries before calling the matcher.
+    """
+
+    def __init__(self, cell_ids: List[str]):
+        needles = sorted({f"_{cid}" for cid in cell_ids})
+        # An overlapping, longest-first search finds the longest needle at each position;
+        # needles that are a prefix of a hit are added back via this table.
+        self._prefixes: Dict[str, List[str]] = {n: [] for n in needles}
+        for i, n in enumerate(needles):
+            for longer in needles[i + 1:]:
+                if not longer.startswith(n):
+                    break
+                self._prefixes[longer].append(n)
+        # (?!) never matches: an empty cell list matches nothing
+        alternation = "|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)) or "(?!)"
+        self.search = re.compile(alternation).search
+        self._finditer = re.compile(f"(?=({alternation}))").finditer
+
+    def __call__(self, name: str) -> List[str]:
+        hits: List[str] = []
+        for m in self._finditer(name):
+            needle = m.group(1)
+            for n in (needle, *self._prefixes[needle]):
+                cid = n[1:]
+                if cid not in hits:
+                    hits.append(cid)
+        return hits
+
+def compile_cell_matcher(cell_ids: List[str]) -> CellMatcher:
+    return CellMatcher(cell_ids)
+
+def scan_candidate_dir(candidate_dir: str, match_cells: CellMatcher) -> List[MatchResult]:
+    """
+    Single directory read of candidate_dir; returns a MatchResult for every
+    (image folder, cell_id) pair reported by match_cells.
+    """
+    results: List[MatchResult] = []
+    for f, cell_ids in find_matching_image_folders(candidate_dir, match_cells):
+        timestamp_key = extract_timestamp_key(os.path.basename(f))
+        images = find_required_images(f, cell_ids)
+        for cell_id in cell_ids:
+            img0, img1 = images[cell_id]
+            results.append(
+                MatchResult(
+                    cell_id=cell_id,
+                    folder=f,
+                    category_dir=candidate_dir,
+                    img0=img0,
+                    img1=img1,
+                    timestamp_key=timestamp_key,
                 )
+            )
     return results
 
+def search_matches_in_dirs(dirs: List[str], cell_ids: List[str]) -> Dict[str, List[MatchResult]]:
+    """
+    Reads every dir in dirs once for all cell_ids.
+    Returns {cell_id: [MatchResult, ...]} (cells without matches are absent).
+    """
+    match_cells = compile_cell_matcher(cell_ids)
+    by_cell: Dict[str, List[MatchResult]] = {}
+    for d in dirs:
+        for r in scan_candidate_dir(d, match_cells):
+            by_cell.setdefault(r.cell_id, []).append(r)
+    return by_cell
+
+def search_matches_for_cells(base_dir: Path, yyyy: str, mm: str, dd: str, cell_ids: List[str]) -> Dict[str, List[MatchResult]]:
+    return search_matches_in_dirs(candidate_dirs(os.path.join(base_dir, yyyy, mm, dd)), cell_ids)
+
+def search_matches_for_cell(base_dir: Path, yyyy: str, mm: str, dd: str, cell_id: str) -> List[MatchResult]:
+    return search_matches_for_cells(base_dir, yyyy, mm, dd, [cell_id]).get(cell_id, [])
+
 def choose_best_match(matches: List[MatchResult]) -> Optional[MatchResult]:
     """
     Choose the latest by timestamp_key; tie-break by folder name.
     """
     if not matches:
         return None
-    return sorted(matches, key=lambda r: (r.timestamp_key, r.folder.name))[-1]
+    # reversed(): on a full tie keep the last one, as sorted(...)[-1] did
+    return max(reversed(matches), key=lambda r: (r.timestamp_key, os.path.basename(r.folder)))
+
+def _copy_into(src: str, dest_dir: Path, errors: Optional[List[str]] = None) -> Optional[Path]:
+    # No exists() pre-check: the file was just listed by scandir; a vanished file just yields None.
+    dest = dest_dir / os.path.basename(src)
+    try:
+        _copy_file(src, str(dest))
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        # permission / locked file: skip this image, the caller still copies the other one
+        if errors is not None:
+            errors.append(f"{os.path.basename(src)}: {e}")
+        return None
+    return dest
 
-def copy_images(result: MatchResult, out_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
+def copy_images(
+    result: MatchResult, out_dir: Path, errors: Optional[List[str]] = None
+) -> Tuple[Optional[Path], Optional[Path]]:
     """
     Copy img0/img1 into out_dir/<cell_id>/ keeping filenames.
-    Returns destination paths (or None for missing).
+    Returns destination paths (or None for missing / failed).
+    A failed copy is reported in `errors` and doesn't stop the other image.
     """
     dest_dir = out_dir / result.cell_id
     dest_dir.mkdir(parents=True, exist_ok=True)
-    dest0 = dest1 = None
-
-    if result.img0 and result.img0.exists():
-        dest0 = dest_dir / result.img0.name
-        shutil.copy2(result.img0, dest0)
-    if result.img1 and result.img1.exists():
-        dest1 = dest_dir / result.img1.name
-        shutil.copy2(result.img1, dest1)
-
+    dest0 = _copy_into(result.img0, dest_dir, errors) if result.img0 else None
+    dest1 = _copy_into(result.img1, dest_dir, errors) if result.img1 else None
     return dest0, dest1
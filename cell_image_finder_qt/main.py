@@ -1,11 +1,16 @@
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QBrush
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QMainWindow, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, QDateEdit,
@@ -13,27 +18,32 @@ from PyQt6.QtWidgets import (
     QMessageBox, QCheckBox, QComboBox
 )
 
-from finder import parse_date, search_matches_for_cell, choose_best_match, copy_images
+from finder import (
+    MatchResult, parse_date, compile_cell_matcher, candidate_dirs, scan_candidate_dir,
+    choose_best_match, copy_images,
+)
+
+# Directory reads release the GIL, so a few threads hide network-share latency.
+SCAN_WORKERS = 16
+# Copies run in the background while rows keep being reported.
+COPY_WORKERS = 4
+# Rows are sent to the GUI in batches of this size, or at least this often.
+ROW_BATCH_SIZE = 50
+ROW_BATCH_SECONDS = 0.2
+
+
+_CELL_SEP_RE = re.compile(r"[,\s]+")
 
 
 def normalize_cell_ids(text: str) -> List[str]:
-    raw = []
-    for part in text.replace(",", " ").split():
-        p = part.strip()
-        if p:
-            raw.append(p)
-    seen = set()
-    out = []
-    for x in raw:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    # split on commas/whitespace, then order-preserving dedup
+    return [x for x in dict.fromkeys(_CELL_SEP_RE.split(text.strip())) if x]
 
 
 class SearchWorker(QThread):
     progress = pyqtSignal(int, int)   # done, total
-    row_result = pyqtSignal(dict)     # per-cell result
+    rows_batch = pyqtSignal(list)     # per-cell results (list of dict)
+    copy_done = pyqtSignal(str, str)  # cell_id, copied folder ("" if nothing copied)
     log = pyqtSignal(str)
     finished_ok = pyqtSignal()
     failed = pyqtSignal(str)
@@ -70,7 +80,6 @@ class SearchWorker(QThread):
                 return
 
             total = len(self.cell_ids)
-            done = 0
 
             self.log.emit(f"Base: {base_dir}")
             self.log.emit(f"Date: {self.yyyy}-{self.mm}-{self.dd}")
@@ -83,15 +92,53 @@ class SearchWorker(QThread):
                 self.out_dir.mkdir(parents=True, exist_ok=True)
                 self.log.emit(f"Copy output: {self.out_dir}")
 
+            # Read each hour/sub dir once for all cells, then report per cell.
+            match_cells = compile_cell_matcher(self.cell_ids)
+            by_cell: Dict[str, List[MatchResult]] = {}
+            dirs = candidate_dirs(os.path.join(base_dir, self.yyyy, self.mm, self.dd))
+            self.log.emit(f"Scanning {len(dirs)} folder(s)…")
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+                futures = [pool.submit(scan_candidate_dir, d, match_cells) for d in dirs]
+                for scanned, fut in enumerate(as_completed(futures), start=1):
+                    if self._stop:
+                        for f in futures:
+                            f.cancel()
+                        self.log.emit("Stopped by user.")
+                        return
+                    for r in fut.result():
+                        by_cell.setdefault(r.cell_id, []).append(r)
+                    self.progress.emit(scanned, len(dirs))
+
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as copy_pool:
+                copy_futures = {}
+                try:
+                    self._report_cells(by_cell, copy_pool, copy_futures)
+                    self._wait_copies(copy_futures)
+                finally:
+                    for f in copy_futures:
+                        f.cancel()
+
+            if not self._stop:
+                self.finished_ok.emit()
+
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def _report_cells(self, by_cell: Dict[str, List[MatchResult]], copy_pool: ThreadPoolExecutor, copy_futures: dict):
+        total = len(self.cell_ids)
+        done = 0
+        batch: List[dict] = []
+        last_flush = time.monotonic()
+        try:
             for cell_id in self.cell_ids:
                 if self._stop:
                     self.log.emit("Stopped by user.")
                     return
 
-                matches = search_matches_for_cell(base_dir, self.yyyy, self.mm, self.dd, cell_id)
+                matches = by_cell.get(cell_id, [])
 
                 if not matches:
-                    self.row_result.emit({
+                    batch.append({
                         "cell_id": cell_id,
                         "status": "NOT FOUND",
                         "match_count": 0,
@@ -106,39 +153,73 @@ class SearchWorker(QThread):
                     best = choose_best_match(matches)
                     to_show = best if (self.choose_latest_only and best) else (best or matches[0])
 
-                    copied0 = copied1 = ""
-                    if self.do_copy and to_show:
-                        d0, d1 = copy_images(to_show, self.out_dir)
-                        copied0 = str(d0) if d0 else ""
-                        copied1 = str(d1) if d1 else ""
+                    # nothing to copy (no img0/img1) keeps the copy column empty
+                    copying = bool(self.do_copy and (to_show.img0 or to_show.img1))
+                    if copying:
+                        errors: List[str] = []
+                        fut = copy_pool.submit(copy_images, to_show, self.out_dir, errors)
+                        copy_futures[fut] = (cell_id, errors)
 
-                    self.row_result.emit({
+                    batch.append({
                         "cell_id": cell_id,
                         "status": "FOUND",
                         "match_count": len(matches),
-                        "category": str(to_show.category_dir),
-                        "folder": str(to_show.folder),
-                        "img0": str(to_show.img0) if to_show.img0 else "",
-                        "img1": str(to_show.img1) if to_show.img1 else "",
-                        "copied0": copied0,
-                        "copied1": copied1,
+                        "category": to_show.category_dir,
+                        "folder": to_show.folder,
+                        "img0": to_show.img0 or "",
+                        "img1": to_show.img1 or "",
+                        "copied0": "",
+                        "copied1": "",
+                        "copying": copying,
                     })
 
                 done += 1
+                if len(batch) >= ROW_BATCH_SIZE or time.monotonic() - last_flush >= ROW_BATCH_SECONDS:
+                    self.rows_batch.emit(batch)
+                    self.progress.emit(done, total)
+                    batch = []
+                    last_flush = time.monotonic()
+        finally:
+            if batch:
+                self.rows_batch.emit(batch)
                 self.progress.emit(done, total)
 
-            self.finished_ok.emit()
-
-        except Exception as e:
-            self.failed.emit(str(e))
+    def _wait_copies(self, copy_futures: dict):
+        if self._stop or not copy_futures:
+            return
+        self.log.emit(f"Waiting for {len(copy_futures)} copy job(s)…")
+        for fut in as_completed(copy_futures):
+            if self._stop:
+                self.log.emit("Stopped by user.")
+                return
+            cell_id, errors = copy_futures[fut]
+            try:
+                d0, d1 = fut.result()
+            except OSError as e:
+                self.log.emit(f"Copy failed for {cell_id}: {e}")
+                self.copy_done.emit(cell_id, "")
+                continue
+            # per-image failures; whatever did copy is still reported below
+            for msg in errors:
+                self.log.emit(f"Copy failed for {cell_id}: {msg}")
+            any_copy = d0 or d1
+            self.copy_done.emit(cell_id, str(any_copy.parent) if any_copy else "")
 
 
 class MainWindow(QMainWindow):
+    # shared by every result cell instead of being rebuilt per item
+    _RO_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+    _STATUS_BRUSH = {
+        "FOUND": QBrush(Qt.GlobalColor.green),
+        "NOT FOUND": QBrush(Qt.GlobalColor.yellow),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Cell Image Finder (JF2)")
 
         self.worker: Optional[SearchWorker] = None
+        self._row_by_cell: Dict[str, int] = {}
 
         root = QWidget()
         self.setCentralWidget(root)
@@ -246,14 +327,28 @@ class MainWindow(QMainWindow):
 
     def clear_results(self):
         self.table.setRowCount(0)
+        self._row_by_cell.clear()
+
+    def add_rows(self, results: list):
+        # one resize + no repaints while the batch is filled in
+        start = self.table.rowCount()
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(start + len(results))
+            for row, result in enumerate(results, start=start):
+                self._fill_row(row, result)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-    def add_row(self, result: dict):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+    def _fill_row(self, row: int, result: dict):
+        self._row_by_cell[result.get("cell_id", "")] = row
+        brush = self._STATUS_BRUSH.get(result.get("status", ""))
 
         def put(col: int, val: str):
             item = QTableWidgetItem(val)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            item.setFlags(self._RO_FLAGS)
+            if brush is not None:
+                item.setBackground(brush)
             self.table.setItem(row, col, item)
 
         put(0, result.get("cell_id", ""))
@@ -268,19 +363,15 @@ class MainWindow(QMainWindow):
         if result.get("copied0") or result.get("copied1"):
             any_copy = result.get("copied0") or result.get("copied1")
             copied_folder = str(Path(any_copy).parent)
+        elif result.get("copying"):
+            copied_folder = "Copying…"
         put(7, copied_folder)
 
-        status = result.get("status", "")
-        if status == "FOUND":
-            for c in range(self.table.columnCount()):
-                it = self.table.item(row, c)
-                if it:
-                    it.setBackground(Qt.GlobalColor.green)
-        elif status == "NOT FOUND":
-            for c in range(self.table.columnCount()):
-                it = self.table.item(row, c)
-                if it:
-                    it.setBackground(Qt.GlobalColor.yellow)
+    def on_copy_done(self, cell_id: str, copied_folder: str):
+        row = self._row_by_cell.get(cell_id)
+        it = self.table.item(row, 7) if row is not None else None
+        if it:
+            it.setText(copied_folder or "Copy failed")
 
     def run_search(self):
         drive = self.drive_box.currentText().strip() or "E"
@@ -327,7 +418,8 @@ class MainWindow(QMainWindow):
             out_dir=out_dir,
         )
         self.worker.progress.connect(self.on_progress)
-        self.worker.row_result.connect(self.add_row)
+        self.worker.rows_batch.connect(self.add_rows)
+        self.worker.copy_done.connect(self.on_copy_done)
         self.worker.log.connect(self.append_log)
         self.worker.finished_ok.connect(self.on_done)
         self.worker.failed.connect(self.on_failed)
@@ -340,6 +432,8 @@ class MainWindow(QMainWindow):
             self.stop_btn.setEnabled(False)
 
     def on_progress(self, done: int, total: int):
+        # total switches from folders scanned to cells reported
+        self.progress.setMaximum(total)
         self.progress.setValue(done)
         self.progress.setFormat(f"{done}/{total}")
 
@@ -2,26 +2,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
+import os
 import shutil
 import re
 
-CANDIDATE_SUBDIRS = [
-    Path("NG"),
-    Path("OK") / "DL_CANDIDATE",
-    Path("OK") / "DL_OK",
-]
+# Plain str paths throughout, from the scan to the copy destinations shown in the table.
+CANDIDATE_SUBDIRS = (
+    "NG",
+    os.path.join("OK", "DL_CANDIDATE"),
+    os.path.join("OK", "DL_OK"),
+)
 
 @dataclass
 class MatchResult:
     cell_id: str
-    folder: Path
-    category_dir: Path
-    img0: Optional[Path]
-    img1: Optional[Path]
+    folder: str
+    category_dir: str
+    img0: Optional[str]
+    img1: Optional[str]
     timestamp_key: str  # sortable key extracted from folder name (YYYYMMDD_HHMMSS)
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> Tuple[str, str, str]:
     """
     Accepts YYYY-MM-DD or YYYY/MM/DD.
@@ -38,28 +42,51 @@ def parse_date(date_str: str) -> Tuple[str, str, str]:
         raise ValueError("Month and Day must be numeric.")
     return yyyy, mm.zfill(2), dd.zfill(2)
 
-def iter_hour_dirs(date_root: Path) -> Iterable[Path]:
+def iter_hour_dirs(date_root: str) -> Iterable[str]:
     for h in range(24):
-        yield date_root / f"{h:02d}"
-
-def _safe_listdir(p: Path) -> List[Path]:
-    try:
-        return list(p.iterdir())
-    except Exception:
-        return []
-
-def find_matching_image_folders(search_dir: Path, cell_id: str) -> List[Path]:
+        yield os.path.join(date_root, f"{h:02d}")
+
+class CellMatcher:
+    """Cell ids whose _{cell_id} occurs in a folder name; `search` is the cheap prefilter."""
+
+    def __init__(self, cell_ids: List[str]):
+        needles = sorted({f"_{cid}" for cid in cell_ids})
+        # An overlapping, longest-first search finds the longest needle at each position;
+        # needles that are a prefix of a hit are added back via this table.
+        self._prefixes: Dict[str, List[str]] = {n: [] for n in needles}
+        for i, n in enumerate(needles):
+            for longer in needles[i + 1:]:
+                if not longer.startswith(n):
+                    break
+                self._prefixes[longer].append(n)
+        # (?!) never matches: an empty cell list matches nothing
+        alternation = "|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)) or "(?!)"
+        self.search = re.compile(alternation).search
+        self._finditer = re.compile(f"(?=({alternation}))").finditer
+
+    def __call__(self, name: str) -> List[str]:
+        hits: List[str] = []
+        for m in self._finditer(name):
+            needle = m.group(1)
+            for n in (needle, *self._prefixes[needle]):
+                cid = n[1:]
+                if cid not in hits:
+                    hits.append(cid)
+        return hits
+
+def find_matching_image_folders(search_dir: str, matcher: CellMatcher) -> List[Tuple[str, List[str]]]:
     """
-    Returns immediate subfolders in search_dir whose name contains _{cell_id}
+    Returns (subfolder, cell_ids) for immediate subfolders in search_dir whose name
+    contains _{cell_id} for any cell of matcher
     """
-    if not search_dir.exists() or not search_dir.is_dir():
+    hit = matcher.search
+    try:
+        with os.scandir(search_dir) as it:
+            # DirEntry.is_dir() uses the type info from the directory read (no extra stat)
+            folders = [e for e in it if hit(e.name) is not None and e.is_dir(follow_symlinks=False)]
+    except OSError:
         return []
-    needle = f"_{cell_id}"
-    matches: List[Path] = []
-    for p in _safe_listdir(search_dir):
-        if p.is_dir() and needle in p.name:
-            matches.append(p)
-    return matches
+    return [(e.path, matcher(e.name)) for e in folders]
 
 def extract_timestamp_key(folder_name: str) -> str:
     """
@@ -71,38 +98,67 @@ def extract_timestamp_key(folder_name: str) -> str:
     m = re.match(r"^(\d{8}_\d{6})_", folder_name)
     return m.group(1) if m else ""
 
-def find_required_images(image_folder: Path, cell_id: str) -> Tuple[Optional[Path], Optional[Path]]:
-    pat0 = f"*_{cell_id}_EXT_DL_0_2.jpg"
-    pat1 = f"*_{cell_id}_EXT_DL_1_2.jpg"
-    img0 = next(iter(image_folder.glob(pat0)), None)
-    img1 = next(iter(image_folder.glob(pat1)), None)
-    return img0, img1
+# *_<CELLID>_EXT_DL_0_2.jpg / *_<CELLID>_EXT_DL_1_2.jpg (case-insensitive, as glob() was on Windows)
+_IMG_RE = re.compile(r"_EXT_DL_([01])_2\.jpg$", re.IGNORECASE)
 
-def search_matches_for_cell(base_dir: Path, yyyy: str, mm: str, dd: str, cell_id: str) -> List[MatchResult]:
-    date_root = base_dir / yyyy / mm / dd
-    results: List[MatchResult] = []
-    if not date_root.exists():
-        return results
+def find_required_images(image_folder: str, cell_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Single directory read collecting *_{cell_id}_EXT_DL_0_2.jpg and *_{cell_id}_EXT_DL_1_2.jpg
+    for every cell_id whose name matched image_folder.
+    Returns {cell_id: (img0, img1)}.
+    """
+    needles = [(f"_{cid}".lower(), cid) for cid in cell_ids]
+    found: Dict[str, List[Optional[str]]] = {cid: [None, None] for cid in cell_ids}
+    try:
+        with os.scandir(image_folder) as it:
+            for e in it:
+                m = _IMG_RE.search(e.name)
+                if m is None:
+                    continue
+                head = e.name[:m.start()].lower()
+                k = 0 if m.group(1) == "0" else 1
+                for needle, cid in needles:
+                    slot = found[cid]
+                    if slot[k] is None and head.endswith(needle):
+                        slot[k] = e.path
+    except OSError:
+        pass
+    return {cid: (v[0], v[1]) for cid, v in found.items()}
+
+def build_date_index(base_dir: str, ymd: str, matcher: CellMatcher) -> Dict[str, List[MatchResult]]:
+    """
+    Walks one date folder (ymd = YYYYMMDD) once and returns {cell_id: [MatchResult, ...]}
+    for every cell of matcher (cells without matches are absent).
+    """
+    date_root = os.path.join(base_dir, ymd[:4], ymd[4:6], ymd[6:8])
+    index: Dict[str, List[MatchResult]] = {}
+    if not os.path.isdir(date_root):
+        return index
 
     for hour_dir in iter_hour_dirs(date_root):
-        if not hour_dir.exists():
+        if not os.path.isdir(hour_dir):
             continue
         for sub in CANDIDATE_SUBDIRS:
-            candidate_dir = hour_dir / sub
-            folders = find_matching_image_folders(candidate_dir, cell_id)
-            for f in folders:
-                img0, img1 = find_required_images(f, cell_id)
-                results.append(
-                    MatchResult(
-                        cell_id=cell_id,
-                        folder=f,
-                        category_dir=candidate_dir,
-                        img0=img0,
-                        img1=img1,
-                        timestamp_key=extract_timestamp_key(f.name),
+            candidate_dir = os.path.join(hour_dir, sub)
+            for f, cell_ids in find_matching_image_folders(candidate_dir, matcher):
+                timestamp_key = extract_timestamp_key(os.path.basename(f))
+                images = find_required_images(f, cell_ids)
+                for cell_id in cell_ids:
+                    img0, img1 = images[cell_id]
+                    index.setdefault(cell_id, []).append(
+                        MatchResult(
+                            cell_id=cell_id,
+                            folder=f,
+                            category_dir=candidate_dir,
+                            img0=img0,
+                            img1=img1,
+                            timestamp_key=timestamp_key,
+                        )
                     )
-                )
-    return results
+    return index
+
+def search_matches_for_cell(base_dir: str, ymd: str, cell_id: str) -> List[MatchResult]:
+    return build_date_index(base_dir, ymd, CellMatcher([cell_id])).get(cell_id, [])
 
 def choose_best_match(matches: List[MatchResult]) -> Optional[MatchResult]:
     """
@@ -110,23 +166,25 @@ def choose_best_match(matches: List[MatchResult]) -> Optional[MatchResult]:
     """
     if not matches:
         return None
-    return sorted(matches, key=lambda r: (r.timestamp_key, r.folder.name))[-1]
+    return sorted(matches, key=lambda r: (r.timestamp_key, os.path.basename(r.folder)))[-1]
+
+def _copy_into(src: str, dest_dir: str) -> Optional[str]:
+    # No exists() pre-check: the file was just listed by scandir; a vanished file just yields None.
+    dest = os.path.join(dest_dir, os.path.basename(src))
+    try:
+        shutil.copy2(src, dest)
+    except FileNotFoundError:
+        return None
+    return dest
 
-def copy_images(result: MatchResult, out_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
+def copy_images(result: MatchResult, out_dir: Path) -> Tuple[Optional[str], Optional[str]]:
     """
     Copy img0/img1 into out_dir/<cell_id>/<timestamp_key>/ keeping filenames.
     Returns destination paths (or None for missing).
     """
     ts = result.timestamp_key or "UNKNOWN_TIME"
-    dest_dir = out_dir / result.cell_id / ts
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    dest0 = dest1 = None
-
-    if result.img0 and result.img0.exists():
-        dest0 = dest_dir / result.img0.name
-        shutil.copy2(result.img0, dest0)
-    if result.img1 and result.img1.exists():
-        dest1 = dest_dir / result.img1.name
-        shutil.copy2(result.img1, dest1)
-
+    dest_dir = os.path.join(out_dir, result.cell_id, ts)
+    os.makedirs(dest_dir, exist_ok=True)
+    dest0 = _copy_into(result.img0, dest_dir) if result.img0 else None
+    dest1 = _copy_into(result.img1, dest_dir) if result.img1 else None
     return dest0, dest1
@@ -1,74 +1,65 @@
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+import time
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDate
+from PyQt6.QtGui import QBrush
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QMainWindow, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, QDateEdit,
     QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QGroupBox, QFormLayout,
-    QMessageBox, QCheckBox, QComboBox, QTabWidget, QFrame
+    QMessageBox, QCheckBox, QComboBox, QTabWidget, QFrame, QAbstractItemView
 )
 
-from finder import parse_date, search_matches_for_cell, choose_best_match, copy_images
+from finder import MatchResult, CellMatcher, parse_date, build_date_index, choose_best_match, copy_images
 
 
+# SearchWorker flushes results to the table every ROW_BATCH_SIZE rows or ROW_BATCH_SECONDS
+ROW_BATCH_SIZE = 16
+ROW_BATCH_SECONDS = 0.2
+
+_SEP_RE = re.compile(r"[,\s]+")
+
 def normalize_cell_ids(text: str) -> List[str]:
-    raw = []
-    for part in text.replace(",", " ").split():
-        p = part.strip()
-        if p:
-            raw.append(p)
-    seen = set()
-    out = []
-    for x in raw:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
-
-def parse_date_lines(text: str) -> List[Tuple[str, str, str]]:
+    # one split on commas/whitespace, then order-preserving dedup
+    return list(dict.fromkeys(p for p in _SEP_RE.split(text) if p))
+
+def parse_date_lines(text: str) -> List[str]:
     """
     Accepts lines like:
       2026-01-13
       2026/01/17
     Ignores blank lines and comments starting with '#'.
-    Returns unique dates in the order given.
+    Returns unique dates as YYYYMMDD in the order given.
     """
-    out: List[Tuple[str, str, str]] = []
-    seen = set()
-    for line in text.splitlines():
-        s = line.strip()
-        if not s or s.startswith("#"):
-            continue
-        ymd = parse_date(s)
-        if ymd not in seen:
-            seen.add(ymd)
-            out.append(ymd)
-    return out
-
-def iter_date_range(start_ymd: Tuple[str, str, str], end_ymd: Tuple[str, str, str]) -> List[Tuple[str, str, str]]:
-    ys, ms, ds = start_ymd
-    ye, me, de = end_ymd
-    start = date(int(ys), int(ms), int(ds))
-    end = date(int(ye), int(me), int(de))
+    lines = (line.strip() for line in text.splitlines())
+    # dict.fromkeys keeps first-seen order while dropping duplicates
+    return list(dict.fromkeys(_to_ymd(s) for s in lines if s and not s.startswith("#")))
+
+def _to_ymd(date_str: str) -> str:
+    # through date(): "2024-001-05" becomes 20240105 (not a 9-char key), bad days raise ValueError
+    yyyy, mm, dd = parse_date(date_str)
+    return date(int(yyyy), int(mm), int(dd)).strftime("%Y%m%d")
+
+def iter_date_range(start_ymd: str, end_ymd: str) -> List[str]:
+    start = date(int(start_ymd[:4]), int(start_ymd[4:6]), int(start_ymd[6:]))
+    end = date(int(end_ymd[:4]), int(end_ymd[4:6]), int(end_ymd[6:]))
     if end < start:
         raise ValueError("End date must be the same as or after Start date.")
 
-    out = []
-    cur = start
-    while cur <= end:
-        out.append((f"{cur.year:04d}", f"{cur.month:02d}", f"{cur.day:02d}"))
-        cur += timedelta(days=1)
-    return out
+    # isoformat() is YYYY-MM-DD, already zero-padded
+    return [date.fromordinal(o).isoformat().replace("-", "") for o in range(start.toordinal(), end.toordinal() + 1)]
 
-def qdate_to_ymd(qd: QDate) -> Tuple[str, str, str]:
-    return (f"{qd.year():04d}", f"{qd.month():02d}", f"{qd.day():02d}")
+def qdate_to_ymd(qd: QDate) -> str:
+    return qd.toString("yyyyMMdd")
 
 @dataclass
 class RowPayload:
@@ -85,7 +76,7 @@ class RowPayload:
 
 class SearchWorker(QThread):
     progress = pyqtSignal(int, int)   # done, total
-    row_result = pyqtSignal(object)   # RowPayload
+    rows_batch = pyqtSignal(list)     # List[RowPayload], in cell_ids order
     log = pyqtSignal(str)
     finished_ok = pyqtSignal()
     failed = pyqtSignal(str)
@@ -94,7 +85,7 @@ class SearchWorker(QThread):
         self,
         drive_letter: str,
         sub_path: str,
-        dates_to_search: List[Tuple[str, str, str]],
+        dates_to_search: List[str],  # YYYYMMDD
         cell_ids: List[str],
         choose_latest_only: bool,
         do_copy: bool,
@@ -116,8 +107,8 @@ class SearchWorker(QThread):
 
     def run(self):
         try:
-            base_dir = Path(f"{self.drive_letter}:\\") / self.sub_path
-            if not base_dir.exists():
+            base_dir = os.path.join(f"{self.drive_letter}:\\", self.sub_path)
+            if not os.path.isdir(base_dir):
                 self.failed.emit(f"Base directory does not exist:\n{base_dir}")
                 return
 
@@ -135,63 +126,79 @@ class SearchWorker(QThread):
                 self.out_dir.mkdir(parents=True, exist_ok=True)
                 self.log.emit(f"Copy output: {self.out_dir}")
 
-            for cell_id in self.cell_ids:
+            # Walk each date folder once for all cells, then report per cell.
+            matcher = CellMatcher(self.cell_ids)
+            by_cell: Dict[str, List[MatchResult]] = {}
+            n_dates = len(self.dates_to_search)
+            for i, ymd in enumerate(self.dates_to_search, start=1):
                 if self._stop:
                     self.log.emit("Stopped by user.")
                     return
-
-                all_matches = []
-                for (yyyy, mm, dd) in self.dates_to_search:
+                for cell_id, matches in build_date_index(base_dir, ymd, matcher).items():
+                    by_cell.setdefault(cell_id, []).extend(matches)
+                self.progress.emit(i, n_dates)
+
+            # rows go to the GUI in batches: one queued signal per batch, not per cell
+            batch: List[RowPayload] = []
+            last_flush = time.monotonic()
+            try:
+                for cell_id in self.cell_ids:
                     if self._stop:
                         self.log.emit("Stopped by user.")
                         return
-                    matches = search_matches_for_cell(base_dir, yyyy, mm, dd, cell_id)
-                    all_matches.extend(matches)
-
-                if not all_matches:
-                    payload = RowPayload(
-                        cell_id=cell_id,
-                        status="NOT FOUND",
-                        match_count=0,
-                        chosen_date="",
-                        category="",
-                        folder="",
-                        img0="",
-                        img1="",
-                        copied_folder="",
-                    )
-                    self.row_result.emit(payload)
-                else:
-                    best = choose_best_match(all_matches)
-                    to_show = best if (self.choose_latest_only and best) else (best or all_matches[0])
-
-                    copied_folder = ""
-                    if self.do_copy and to_show:
-                        d0, d1 = copy_images(to_show, self.out_dir)
-                        # copied folder based on any copied path
-                        any_copy = d0 or d1
-                        copied_folder = str(any_copy.parent) if any_copy else ""
-
-                    chosen_date = ""
-                    if to_show and to_show.timestamp_key:
-                        # timestamp_key starts with YYYYMMDD
-                        chosen_date = to_show.timestamp_key.split("_")[0]  # YYYYMMDD
-
-                    payload = RowPayload(
-                        cell_id=cell_id,
-                        status="FOUND",
-                        match_count=len(all_matches),
-                        chosen_date=chosen_date,
-                        category=str(to_show.category_dir),
-                        folder=str(to_show.folder),
-                        img0=str(to_show.img0) if to_show.img0 else "",
-                        img1=str(to_show.img1) if to_show.img1 else "",
-                        copied_folder=copied_folder,
-                    )
-                    self.row_result.emit(payload)
-
-                done += 1
-                self.progress.emit(done, total)
+
+                    all_matches = by_cell.get(cell_id, [])
+
+                    if not all_matches:
+                        payload = RowPayload(
+                            cell_id=cell_id,
+                            status="NOT FOUND",
+                            match_count=0,
+                            chosen_date="",
+                            category="",
+                            folder="",
+                            img0="",
+                            img1="",
+                            copied_folder="",
+                        )
+                        batch.append(payload)
+                    else:
+                        best = choose_best_match(all_matches)
+                        to_show = best if (self.choose_latest_only and best) else (best or all_matches[0])
+
+                        copied_folder = ""
+                        if self.do_copy and to_show:
+                            d0, d1 = copy_images(to_show, self.out_dir)
+                            # copied folder based on any copied path
+                            any_copy = d0 or d1
+                            copied_folder = os.path.dirname(any_copy) if any_copy else ""
+
+                        # timestamp_key starts with YYYYMMDD ("" when the folder had none)
+                        chosen_date = to_show.timestamp_key[:8]
+
+                        payload = RowPayload(
+                            cell_id=cell_id,
+                            status="FOUND",
+                            match_count=len(all_matches),
+                            chosen_date=chosen_date,
+                            category=to_show.category_dir,
+                            folder=to_show.folder,
+                            img0=to_show.img0 or "",
+                            img1=to_show.img1 or "",
+                            copied_folder=copied_folder,
+                        )
+                        batch.append(payload)
+
+                    done += 1
+                    if len(batch) >= ROW_BATCH_SIZE or time.monotonic() - last_flush >= ROW_BATCH_SECONDS:
+                        self.rows_batch.emit(batch)
+                        self.progress.emit(done, total)
+                        batch = []
+                        last_flush = time.monotonic()
+            finally:
+                if batch:
+                    self.rows_batch.emit(batch)
+                    self.progress.emit(done, total)
 
             self.finished_ok.emit()
 
@@ -308,11 +315,18 @@ def apply_modern_styles(app: QApplication):
 
 
 class MainWindow(QMainWindow):
+    # one shared brush per status, applied as each item is created
+    _STATUS_BRUSH = {
+        "FOUND": QBrush(Qt.GlobalColor.lightGray),
+        "NOT FOUND": QBrush(Qt.GlobalColor.lightGray),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Cell Image Finder (JF2)")
 
         self.worker: Optional[SearchWorker] = None
+        self._next_row = 0
 
         root = QWidget()
         root.setObjectName("centralWidget")
@@ -442,6 +456,8 @@ class MainWindow(QMainWindow):
             hdr.setSectionResizeMode(c, QHeaderView.ResizeMode.Stretch)
         self.table.setAlternatingRowColors(True)
         self.table.setWordWrap(False)
+        # read-only at the view level instead of clearing ItemIsEditable on every item
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         outer.addWidget(self.table, 1)
 
         # Log
@@ -463,14 +479,40 @@ class MainWindow(QMainWindow):
 
     def clear_results(self):
         self.table.setRowCount(0)
+        self._next_row = 0
+
+    def prefill_rows(self, cell_ids: List[str]):
+        """
+        Size the table once for all cells (results arrive in cell_ids order);
+        each row shows PENDING until add_rows fills it.
+        """
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(cell_ids))
+            for row, cell_id in enumerate(cell_ids):
+                self.table.setItem(row, 0, QTableWidgetItem(cell_id))
+                self.table.setItem(row, 1, QTableWidgetItem("PENDING"))
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._next_row = 0
+
+    def add_rows(self, payloads: List[RowPayload]):
+        # no repaints while the batch is filled in
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, payload in enumerate(payloads, start=self._next_row):
+                self._fill_row(row, payload)
+            self._next_row += len(payloads)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-    def add_row(self, payload: RowPayload):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+    def _fill_row(self, row: int, payload: RowPayload):
+        brush = self._STATUS_BRUSH.get(payload.status)
 
         def put(col: int, val: str):
             item = QTableWidgetItem(val)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            if brush is not None:
+                item.setBackground(brush)
             self.table.setItem(row, col, item)
 
         put(0, payload.cell_id)
@@ -483,19 +525,7 @@ class MainWindow(QMainWindow):
         put(7, payload.img1)
         put(8, payload.copied_folder)
 
-        if payload.status == "FOUND":
-            # subtle green tint (using selection color isn't allowed here; set background per cell)
-            for c in range(self.table.columnCount()):
-                it = self.table.item(row, c)
-                if it:
-                    it.setBackground(Qt.GlobalColor.lightGray)
-        elif payload.status == "NOT FOUND":
-            for c in range(self.table.columnCount()):
-                it = self.table.item(row, c)
-                if it:
-                    it.setBackground(Qt.GlobalColor.lightGray)
-
-    def get_dates_to_search(self) -> List[Tuple[str, str, str]]:
+    def get_dates_to_search(self) -> List[str]:
         idx = self.date_tabs.currentIndex()
 
         if idx == 0:
@@ -535,6 +565,7 @@ class MainWindow(QMainWindow):
             out_dir = Path(out_text)
 
         self.clear_results()
+        self.prefill_rows(cell_ids)
         self.log_box.clear()
         self.progress.setMaximum(len(cell_ids))
         self.progress.setValue(0)
@@ -552,7 +583,7 @@ class MainWindow(QMainWindow):
             out_dir=out_dir,
         )
         self.worker.progress.connect(self.on_progress)
-        self.worker.row_result.connect(self.add_row)
+        self.worker.rows_batch.connect(self.add_rows)
         self.worker.log.connect(self.append_log)
         self.worker.finished_ok.connect(self.on_done)
         self.worker.failed.connect(self.on_failed)
@@ -568,6 +599,8 @@ class MainWindow(QMainWindow):
             self.stop_btn.setEnabled(False)
 
     def on_progress(self, done: int, total: int):
+        # total switches from dates scanned to cells reported
+        self.progress.setMaximum(total)
         self.progress.setValue(done)
         self.progress.setFormat(f"{done}/{total}")
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-from .csv_reader import iter_rows
+from .config import PARALLEL_MIN_BYTES
+from .csv_reader import iter_columns, total_size
 
-REGIONS = ["LOWER_B_L", "LOWER_B_R", "UPPER_B_L", "UPPER_B_R"]
+REGIONS = ("LOWER_B_L", "LOWER_B_R", "UPPER_B_L", "UPPER_B_R")
 
 # Your CSV has columns like:
 #   LOWER_B_L-NAME, LOWER_B_R-NAME, UPPER_B_L-NAME, UPPER_B_R-NAME
@@ -15,8 +20,24 @@ NAME_COLS = {r: f"{r}-NAME" for r in REGIONS}
 
 CELL_ID_COL = "CELL-ID"
 
+# raw name -> normalize_class() result; the class vocabulary is small, so this stays tiny
+_NORMALIZE_CACHE: Dict[str, Optional[str]] = {}
+_SENTINEL = object()
+
 
 def normalize_class(name: str) -> Optional[str]:
+    """
+    Normalize class names to something stable for UI (memoized, see _normalize_class).
+    """
+    cached = _NORMALIZE_CACHE.get(name, _SENTINEL)
+    if cached is not _SENTINEL:
+        return cached
+    cls = _normalize_class(name)
+    _NORMALIZE_CACHE[name] = cls
+    return cls
+
+
+def _normalize_class(name: str) -> Optional[str]:
     """
     Normalize class names to something stable for UI.
 
@@ -63,45 +84,82 @@ class BAreaSummary:
     cell_counts: Dict[str, int]
 
 
-def summarize_b_area(paths: List[Path]) -> BAreaSummary:
-    region_counts: Dict[str, Dict[str, int]] = {}
-    cell_sets: Dict[str, Set[str]] = {}
-    all_cells: Set[str] = set()
-    total_rows = 0
-
-    for p in paths:
-        for row in iter_rows(p):
-            total_rows += 1
-            cell_id = (row.get(CELL_ID_COL) or "").strip()
-            if cell_id:
-                all_cells.add(cell_id)
-
-            # collect classes hit for this cell (dedupe within row)
-            classes_in_row: Set[str] = set()
-
-            for region in REGIONS:
-                raw_name = (row.get(NAME_COLS[region]) or "").strip()
-                cls = normalize_class(raw_name)
-                if not cls:
-                    continue
-
-                classes_in_row.add(cls)
+def _group_rows(path: Path, cols: List[str]) -> Counter[Tuple[str, ...]]:
+    """
+    (cell_id, raw name per region) -> number of rows for one file; repeated rows collapse here.
+    Module-level so it can run in a worker process.
+    """
+    # count raw tuples in C, then strip once per distinct tuple instead of once per row
+    raw: Counter[Tuple[str, ...]] = Counter(iter_columns(path, cols))
+    groups: Counter[Tuple[str, ...]] = Counter()
+    for values, n in raw.items():
+        groups[tuple(v.strip() for v in values)] += n
+    return groups
 
-                if cls not in region_counts:
-                    region_counts[cls] = {r: 0 for r in REGIONS}
-                region_counts[cls][region] += 1
 
-            if cell_id:
-                for cls in classes_in_row:
-                    if cls not in cell_sets:
-                        cell_sets[cls] = set()
-                    cell_sets[cls].add(cell_id)
+def summarize_b_area(paths: List[Path]) -> BAreaSummary:
+    """
+    Two passes: rows are first grouped by their raw (cell_id, names...) values,
+    then each distinct group is normalized and counted once, weighted by its size.
+    Parsing is CPU-bound, so with several large enough files the first pass runs one
+    process per file.
+    """
+    cols = [CELL_ID_COL, *(NAME_COLS[r] for r in REGIONS)]
+    groups: Counter[Tuple[str, ...]] = Counter()
+
+    if len(paths) > 1 and total_size(paths) >= PARALLEL_MIN_BYTES:
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in path order, so merged groups keep first-seen order
+            for part in pool.map(_group_rows, paths, repeat(cols)):
+                groups.update(part)
+    else:
+        for p in paths:
+            groups.update(_group_rows(p, cols))
+
+    # every row landed in exactly one group
+    total_rows = sum(groups.values())
 
-    cell_counts = {cls: len(s) for cls, s in cell_sets.items()}
+    region_counts: Dict[str, Dict[str, int]] = {}
+    # Each distinct cell gets a dense index; per class, a bytearray flags the cells seen
+    # (1 byte per cell instead of a hash-set entry per class and cell).
+    cell_index: Dict[str, int] = {}
+    cell_flags: Dict[str, bytearray] = {}
+    regions = REGIONS
+    norm = normalize_class
+
+    for (cell_id, *raw_names), n in groups.items():
+        idx = cell_index.setdefault(cell_id, len(cell_index)) if cell_id else -1
+
+        # collect classes hit for this cell (dedupe within row)
+        classes_in_row: Set[str] = set()
+
+        for region, raw_name in zip(regions, raw_names):
+            cls = norm(raw_name)
+            if not cls:
+                continue
+
+            classes_in_row.add(cls)
+
+            if cls not in region_counts:
+                region_counts[cls] = dict.fromkeys(regions, 0)
+            region_counts[cls][region] += n
+
+        if idx >= 0:
+            for cls in classes_in_row:
+                flags = cell_flags.get(cls)
+                if flags is None:
+                    flags = cell_flags[cls] = bytearray()
+                if idx >= len(flags):
+                    # grow geometrically so appends stay amortized O(1)
+                    flags.extend(bytes(max(idx + 1, 2 * len(flags)) - len(flags)))
+                flags[idx] = 1
+
+    cell_counts = {cls: flags.count(1) for cls, flags in cell_flags.items()}
 
     return BAreaSummary(
         total_rows=total_rows,
-        total_cells=len(all_cells),
+        total_cells=len(cell_index),
         region_counts=region_counts,
         cell_counts=cell_counts,
     )
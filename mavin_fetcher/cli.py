@@ -8,7 +8,7 @@ from .config import DEFAULT_DRIVES, DEFAULT_MODEL
 from .copy_engine import copy_overwrite
 from .csv_summary import summarize as summarize_csv, format_summary
 from .date_utils import parse_ymd, date_range_inclusive, parse_dates_csv
-from .path_resolver import find_crop_b_root
+from .path_resolver import find_crop_b_root, find_model_drives
 from .scanner import scan
 
 
@@ -106,11 +106,14 @@ def run_fetch(args) -> int:
     total_overwritten = 0
     missing_days = 0
 
+    # probe E..Z once for the model folder, not once per day
+    model_drives = find_model_drives(model, drives)
+
     total_missing_active = 0
     total_included_active = 0
 
     for day in days:
-        found = find_crop_b_root(model=model, day=day, drives=drives)
+        found = find_crop_b_root(model=model, day=day, drives=model_drives)
         if not found:
             print(f"[WARN] Missing Crop_B folder for {day} (model={model})")
             missing_days += 1
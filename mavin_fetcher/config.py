@@ -13,7 +13,7 @@ BASE_PARTS = ("Files", "Image")
 PIPELINE_PARTS = ("Mavin", "Crop_B")
 
 # Only these are excluded per your requirement
-EXCLUDED_CLASS_FOLDERS = {"01_ok_anode", "01_ok_cathode"}
+EXCLUDED_CLASS_FOLDERS = frozenset({"01_ok_anode", "01_ok_cathode"})
 
 # Drive scan order: E: then F: ... up to Z:
 DEFAULT_DRIVES: Tuple[str, ...] = tuple(chr(c) for c in range(ord("E"), ord("Z") + 1))
@@ -21,6 +21,10 @@ DEFAULT_DRIVES: Tuple[str, ...] = tuple(chr(c) for c in range(ord("E"), ord("Z")
 # File marker
 SOURCEMAP_SUFFIX = "SourceMap.jpg"
 
+# CSV summaries use worker processes only from this much total input; each worker is
+# a fresh interpreter (a full exe start in the frozen build)
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
 
 @dataclass(frozen=True)
 class FoundRoot:
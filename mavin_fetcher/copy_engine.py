@@ -1,8 +1,79 @@
 from __future__ import annotations
 
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, Tuple
+
+# Copies are I/O bound and shutil.copy2 releases the GIL, so a few threads keep the disk queue busy.
+COPY_WORKERS = 8
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _CopyFileW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    _CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _CopyFileW.restype = wintypes.BOOL
+    _ERROR_FILE_EXISTS = 80
+
+    def copy_file(src: Path, dst: Path) -> None:
+        # Kernel-side copy of data + attributes + timestamps (what copy2 does, minus the Python read/write loop);
+        # bFailIfExists=False overwrites.
+        if not _CopyFileW(str(src), str(dst), False):
+            shutil.copy2(src, dst)
+
+    def copy_data(src: Path, dst: Path) -> bool:
+        """
+        Copies src over dst; returns True if dst already existed.
+        The first attempt refuses to overwrite, so its error code answers "existed?" without a stat.
+        """
+        if _CopyFileW(str(src), str(dst), True):
+            return False
+        if ctypes.get_last_error() == _ERROR_FILE_EXISTS:
+            copy_file(src, dst)
+            return True
+        existed = dst.exists()
+        shutil.copy2(src, dst)
+        return existed
+else:
+    def copy_file(src: Path, dst: Path) -> None:
+        # copy2 -> copyfile already uses sendfile()/fcopyfile() here
+        shutil.copy2(src, dst)
+
+    def copy_data(src: Path, dst: Path) -> bool:
+        """
+        Copies the data and timestamps of src over dst (no mode/xattr copy like copy2);
+        returns True if dst already existed. O_EXCL answers "existed?" without a stat.
+        """
+        with open(src, "rb") as fsrc:
+            st = os.fstat(fsrc.fileno())
+            try:
+                fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                existed = False
+            except FileExistsError:
+                fd = os.open(dst, os.O_WRONLY | os.O_TRUNC)
+                existed = True
+            with open(fd, "wb") as fdst:
+                _sendfile(fsrc, fdst, st.st_size)
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return existed
+
+    def _sendfile(fsrc, fdst, size: int) -> None:
+        # kernel-side copy; copyfileobj where sendfile() can't target a regular file (e.g. macOS)
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+            shutil.copyfileobj(fsrc, fdst)
 
 
 def ensure_dir(p: Path) -> None:
@@ -20,11 +91,26 @@ def copy_overwrite(files: Iterable[Path], dest_dir: Path) -> Tuple[int, int]:
     copied = 0
     overwritten = 0
 
+    # One directory read instead of an exists() stat per file; normcase matches
+    # names the way the filesystem does (case-insensitive on Windows).
+    with os.scandir(dest_dir) as it:
+        existing = {os.path.normcase(e.name) for e in it}
+
+    # dst -> src; on a name collision the last file wins, as with sequential copies
+    plan: Dict[Path, Path] = {}
     for src in files:
-        dst = dest_dir / src.name
-        if dst.exists():
+        name = os.path.normcase(src.name)
+        if name in existing:
             overwritten += 1
-        shutil.copy2(src, dst)
+        existing.add(name)
+        plan[dest_dir / src.name] = src
         copied += 1
 
+    if not plan:
+        return copied, overwritten
+
+    with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(plan))) as pool:
+        # list() re-raises the first copy error, like the sequential loop did
+        list(pool.map(copy_file, plan.values(), plan.keys()))
+
     return copied, overwritten
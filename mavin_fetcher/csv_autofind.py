@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 
 @dataclass(frozen=True)
@@ -12,6 +16,7 @@ class CsvMatch:
     path: Path
 
 
+@lru_cache(maxsize=4096)
 def yyyymmdd(d: date) -> str:
     return d.strftime("%Y%m%d")
 
@@ -21,6 +26,53 @@ def _is_ignored_csv(path: Path) -> bool:
     return name.endswith("_defect.csv")
 
 
+# every "_YYYYMMDD" in a name (overlapping), so a file is indexed under each date it could carry
+_DATE_TOKEN_RE = re.compile(r"(?=_(\d{8}))")
+
+
+def _csv_sort_key(name: str) -> Tuple[int, str]:
+    # Prefer base file first, then _1, _2 ... by natural-ish sort.
+    # try to extract trailing _N just before ".csv"
+    n = 0
+    stem = name[:-4] if name.lower().endswith(".csv") else name
+    if "_" in stem:
+        tail = stem.rsplit("_", 1)[-1]
+        if tail.isdigit():
+            n = int(tail)
+    # base file should come first (n=0)
+    return (n, name.lower())
+
+
+@lru_cache(maxsize=8)
+def _csv_dir_index(csv_dir: str, mtime_ns: int) -> Dict[str, Tuple[str, ...]]:
+    """
+    One directory read of csv_dir: {YYYYMMDD: names of non-ignored .csv files containing _YYYYMMDD},
+    each list already in result order (_csv_sort_key). Cached per (dir, mtime) so a multi-day lookup reads the folder once and a changed
+    folder (new/removed file bumps its mtime) is re-read.
+    """
+    index: Dict[str, List[str]] = {}
+    with os.scandir(csv_dir) as it:
+        for e in it:
+            name = e.name
+            if not name.lower().endswith(".csv") or _is_ignored_csv(Path(name)) or not e.is_file():
+                continue
+            for d in dict.fromkeys(_DATE_TOKEN_RE.findall(name)):
+                index.setdefault(d, []).append(name)
+    return {d: tuple(sorted(names, key=_csv_sort_key)) for d, names in index.items()}
+
+
+@lru_cache(maxsize=256)
+def _day_name_re(model: str, d: str) -> "re.Pattern[str]":
+    # Pattern explanation:
+    #   #*-* WELDING VISION(*)_<MODEL>_<DATE>.csv
+    #   #*-* WELDING VISION(*)_<MODEL>_<DATE>_*.csv
+    #
+    # Both globs (base and _N suffix) as one regex, so each name is tested once.
+    # normcase like fnmatch.fnmatch does (case-insensitive on Windows).
+    pat_base = f"#*-* WELDING VISION(*)_{model}_{d}.csv"
+    pat_suffix = f"#*-* WELDING VISION(*)_{model}_{d}_*.csv"
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in (pat_base, pat_suffix)))
+
 
 def find_csvs_for_day(csv_dir: Path, model: str, day: date) -> List[Path]:
     """
@@ -36,41 +88,26 @@ def find_csvs_for_day(csv_dir: Path, model: str, day: date) -> List[Path]:
     We match any "#*-* WELDING VISION" prefix, any polarity, exact model, exact date,
     and optional _N suffix.
     """
-    csv_dir = Path(csv_dir).expanduser().resolve()
+    return _find_csvs_in(Path(csv_dir).expanduser().resolve(), model, day)
+
+
+def _find_csvs_in(csv_dir: Path, model: str, day: date) -> List[Path]:
+    # csv_dir is already expanded/resolved by the caller
     model = (model or "").strip()
     if not model:
         raise ValueError("model is required (e.g., JF2)")
 
     d = yyyymmdd(day)
+    match = _day_name_re(model, d).match
 
-    # Pattern explanation:
-    #   #*-* WELDING VISION(*)_<MODEL>_<DATE>.csv
-    #   #*-* WELDING VISION(*)_<MODEL>_<DATE>_*.csv
-    #
-    # We use glob twice because Path.glob doesn't support {optional} patterns.
-    pat_base = f"#*-* WELDING VISION(*)_{model}_{d}.csv"
-    pat_suffix = f"#*-* WELDING VISION(*)_{model}_{d}_*.csv"
-
-    hits = list(csv_dir.glob(pat_base)) + list(csv_dir.glob(pat_suffix))
-
-    # Deduplicate and sort:
-    # Prefer base file first, then _1, _2 ... by natural-ish sort.
-    uniq = {p.resolve() for p in hits if p.is_file() and not _is_ignored_csv(p)}
-
-
-    def sort_key(p: Path):
-        name = p.name
-        # try to extract trailing _N just before ".csv"
-        n = 0
-        stem = name[:-4] if name.lower().endswith(".csv") else name
-        if "_" in stem:
-            tail = stem.rsplit("_", 1)[-1]
-            if tail.isdigit():
-                n = int(tail)
-        # base file should come first (n=0)
-        return (n, name.lower())
-
-    return sorted(uniq, key=sort_key)
+    # matched against the cached listing instead of two directory walks
+    try:
+        names = _csv_dir_index(str(csv_dir), os.stat(csv_dir).st_mtime_ns).get(d, ())
+    except OSError:
+        return []
+    # The listing is already sorted and has no duplicates (one name per file, children of the
+    # resolved csv_dir), so filtering keeps the order; no per-call dedup, resolve() or sort.
+    return [csv_dir / n for n in names if match(os.path.normcase(n))]
 
 
 def find_csvs_for_days(csv_dir: Path, model: str, days: List[date]) -> List[CsvMatch]:
@@ -78,9 +115,10 @@ def find_csvs_for_days(csv_dir: Path, model: str, days: List[date]) -> List[CsvM
     For multiple days, return a flat list of (day, path) matches.
     Sorted by day then suffix order.
     """
+    csv_dir = Path(csv_dir).expanduser().resolve()  # once, not once per day
     out: List[CsvMatch] = []
     for d in sorted(days):
-        for p in find_csvs_for_day(csv_dir, model, d):
+        for p in _find_csvs_in(csv_dir, model, d):
             out.append(CsvMatch(day=d, path=p))
     return out
 
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import csv
+import os
 from pathlib import Path
-from typing import Dict, Iterable, Iterator
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
-from openpyxl import load_workbook
+
+def total_size(paths: Iterable[Path]) -> int:
+    """Sum of the file sizes in bytes; unreadable/missing files count as 0 (reading reports them)."""
+    total = 0
+    for p in paths:
+        try:
+            total += os.stat(p).st_size
+        except OSError:
+            pass
+    return total
 
 
 def iter_rows(path: Path) -> Iterator[Dict[str, str]]:
@@ -27,20 +37,100 @@ def iter_rows(path: Path) -> Iterator[Dict[str, str]]:
     raise ValueError(f"Unsupported file type: {path.name}")
 
 
+def iter_columns(path: Path, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Like iter_rows, but yields only the given columns as a tuple of strings
+    (in the order of `columns`; "" where a column or value is missing).
+    Column positions are resolved once from the header, so no per-row dict is built.
+    """
+    path = path.expanduser().resolve()
+    suf = path.suffix.lower()
+
+    if suf == ".csv":
+        yield from _iter_csv_columns(path, columns)
+        return
+
+    if suf in (".xlsx", ".xlsm"):
+        yield from _iter_xlsx_columns(path, columns)
+        return
+
+    raise ValueError(f"Unsupported file type: {path.name}")
+
+
+def _column_indices(headers: List[str], columns: Sequence[str]) -> List[int]:
+    # last occurrence wins for duplicate headers, as with the dict rows; -1 = missing
+    pos = {h: i for i, h in enumerate(headers) if h}
+    return [pos.get(c, -1) for c in columns]
+
+
+def _pick(values: Sequence, indices: List[int]) -> Tuple[str, ...]:
+    n = len(values)
+    out = []
+    for i in indices:
+        v = values[i] if 0 <= i < n else None
+        # text cells are already str; only None/numbers need converting
+        out.append(v if type(v) is str else ("" if v is None else str(v)))
+    return tuple(out)
+
+
+def _iter_csv_columns(path: Path, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    with path.open("r", newline="", encoding="utf-8-sig", errors="replace") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        indices = _column_indices(header, columns)
+        for r in reader:
+            # DictReader skips blank lines; so do we
+            if r:
+                yield _pick(r, indices)
+
+
+def _iter_xlsx_columns(path: Path, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    # Lazy import so users without openpyxl can still use CSV
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        rows = ws.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if not header:
+            return
+
+        indices = _column_indices(["" if h is None else str(h) for h in header], columns)
+        for r in rows:
+            yield _pick(r, indices)
+    finally:
+        wb.close()
+
+
 def _iter_csv(path: Path) -> Iterator[Dict[str, str]]:
     with path.open("r", newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # ensure all values are strings
-            out = {}
-            for k, v in row.items():
-                if k is None:
-                    continue
-                out[str(k)] = "" if v is None else str(v)
+        # csv.reader + zip with the header: same dicts DictReader gave us (minus its
+        # restkey entry, which we dropped anyway), without its per-row bookkeeping
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        n = len(headers)
+        for r in reader:
+            # DictReader skips blank lines; so do we
+            if not r:
+                continue
+            out = dict(zip(headers, r))
+            if len(r) < n:
+                # short row: missing trailing columns are ""
+                for k in headers[len(r):]:
+                    out[k] = ""
             yield out
 
 
 def _iter_xlsx(path: Path) -> Iterator[Dict[str, str]]:
+    # Lazy import so users without openpyxl can still use CSV
+    from openpyxl import load_workbook
+
     wb = load_workbook(path, read_only=True, data_only=True)
     try:
         ws = wb.active
@@ -58,7 +148,7 @@ def _iter_xlsx(path: Path) -> Iterator[Dict[str, str]]:
                 key = headers[i] if i < len(headers) else ""
                 if not key:
                     continue
-                row[key] = "" if val is None else str(val)
+                row[key] = val if type(val) is str else ("" if val is None else str(val))
             yield row
     finally:
         wb.close()
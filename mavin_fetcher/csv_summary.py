@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import csv
 
+from .config import PARALLEL_MIN_BYTES
+from .csv_reader import total_size
+
 # Regions we care about
 REGIONS = ("LOWER_B_L", "LOWER_B_R", "UPPER_B_L", "UPPER_B_R")
+NAME_COLS = tuple(f"{r}-NAME" for r in REGIONS)
 
 
 @dataclass
@@ -19,64 +28,150 @@ class Summary:
     overall: Dict[str, int]
 
 
-def _inc(d: Dict[str, int], key: str, n: int = 1) -> None:
-    d[key] = d.get(key, 0) + n
+# rows handed to one C-level counting pass
+CSV_BATCH_ROWS = 8192
+
 
+def _count_rows_slow(rows: List[List[str]], idx: List[int], raw: Counter) -> int:
+    n_rows = 0
+    for r in rows:
+        # DictReader skips blank lines; so do we
+        if not r:
+            continue
+        n_rows += 1
+        n = len(r)
+        raw[tuple(r[i] if 0 <= i < n else "" for i in idx)] += 1
+    return n_rows
 
-def _read_csv_dict_rows(path: Path) -> Iterable[dict]:
+
+def _count_csv_names(path: Path) -> Tuple[int, Counter]:
+    """
+    Reads only the NAME columns of a CSV (by position, no per-row dict).
+    Returns (rows, Counter of stripped (name per region) tuples).
+    """
+    raw: Counter = Counter()
+    rows = 0
     with path.open("r", newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            yield row
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return rows, raw
+        # last occurrence wins for duplicate headers, as with DictReader; -1 = missing
+        pos = {h: i for i, h in enumerate(header)}
+        idx = [pos.get(c, -1) for c in NAME_COLS]
+        # itemgetter + Counter.update count a whole batch in C; a batch with a blank or
+        # short row raises IndexError and is recounted row by row instead.
+        get = itemgetter(*idx) if min(idx) >= 0 else None
+
+        while True:
+            batch = list(islice(reader, CSV_BATCH_ROWS))
+            if not batch:
+                break
+            if get is not None:
+                part: Counter = Counter()
+                try:
+                    part.update(map(get, batch))
+                except IndexError:
+                    pass
+                else:
+                    raw.update(part)
+                    rows += len(batch)
+                    continue
+            rows += _count_rows_slow(batch, idx, raw)
+
+    # strip once per distinct tuple instead of once per row
+    groups: Counter = Counter()
+    for names, n in raw.items():
+        groups[tuple(v.strip() for v in names)] += n
+    return rows, groups
 
 
-def _read_xlsx_dict_rows(path: Path) -> Iterable[dict]:
+def _read_xlsx_name_rows(path: Path) -> Iterator[Tuple[str, ...]]:
+    """
+    Yields the (unstripped) NAME column values of each sheet row as a tuple,
+    picked by position from openpyxl's value tuples instead of a per-row dict.
+    """
     # Lazy import so users without openpyxl can still use CSV
     from openpyxl import load_workbook
 
     wb = load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
-
-    rows_iter = ws.iter_rows(values_only=True)
-    header = next(rows_iter, None)
-    if not header:
-        return
-
-    headers = [str(h).strip() if h is not None else "" for h in header]
-
-    for values in rows_iter:
-        row = {}
-        for i, v in enumerate(values):
-            if i >= len(headers):
-                break
-            row[headers[i]] = "" if v is None else str(v)
-        yield row
-
-
-def _iter_rows(path: Path) -> Iterable[dict]:
+    try:
+        ws = wb.active
+
+        rows_iter = ws.iter_rows(values_only=True)
+        header = next(rows_iter, None)
+        if not header:
+            return
+
+        headers = [str(h).strip() if h is not None else "" for h in header]
+        # last occurrence wins for duplicate headers, as the dict rows did; -1 = missing
+        pos = {h: i for i, h in enumerate(headers)}
+        idx = [pos.get(c, -1) for c in NAME_COLS]
+
+        for values in rows_iter:
+            n = len(values)
+            out = []
+            for i in idx:
+                v = values[i] if 0 <= i < n else None
+                out.append(v if type(v) is str else ("" if v is None else str(v)))
+            yield tuple(out)
+    finally:
+        wb.close()
+
+
+def _count_names(path: Path) -> Tuple[int, Counter]:
     suf = path.suffix.lower()
     if suf == ".csv":
-        return _read_csv_dict_rows(path)
-    if suf in {".xlsx", ".xlsm", ".xltx", ".xltm"}:
-        return _read_xlsx_dict_rows(path)
-    raise ValueError(f"Unsupported file type: {path.name} (expected .csv or .xlsx)")
+        return _count_csv_names(path)
+    if suf not in {".xlsx", ".xlsm", ".xltx", ".xltm"}:
+        raise ValueError(f"Unsupported file type: {path.name} (expected .csv or .xlsx)")
+
+    # as for CSV: count raw tuples, strip once per distinct tuple
+    raw: Counter = Counter(_read_xlsx_name_rows(path))
+    groups: Counter = Counter()
+    for names, n in raw.items():
+        groups[tuple(v.strip() for v in names)] += n
+    return sum(raw.values()), groups
+
+
+def _summarize_one(path: Path) -> Tuple[int, List[Counter]]:
+    """
+    (rows, one name Counter per region) for one file.
+    Module-level so it can run in a worker process; the region split happens there too,
+    so the parent only adds up small per-region Counters.
+    """
+    rows, groups = _count_names(path)
+
+    per_region: List[Counter] = [Counter() for _ in REGIONS]
+    # spread each distinct name tuple's count over the regions
+    for names, n in groups.items():
+        for counts, name in zip(per_region, names):
+            if name:
+                counts[name] += n
+    return rows, per_region
 
 
 def summarize(paths: List[Path]) -> Summary:
-    by_region: Dict[str, Dict[str, int]] = {r: {} for r in REGIONS}
-    overall: Dict[str, int] = {}
+    by_region: Dict[str, Counter] = {r: Counter() for r in REGIONS}
+    overall: Counter = Counter()
     total_rows = 0
 
-    for p in paths:
-        for row in _iter_rows(p):
-            total_rows += 1
-            for region in REGIONS:
-                col = f"{region}-NAME"
-                name = (row.get(col) or "").strip()
-                if not name:
-                    continue
-                _inc(by_region[region], name, 1)
-                _inc(overall, name, 1)
+    # files are independent and parsing is CPU-bound: one worker process per file,
+    # once there is enough input to pay for starting them
+    if len(paths) > 1 and total_size(paths) >= PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+            parts = list(ex.map(_summarize_one, paths))
+    else:
+        parts = [_summarize_one(p) for p in paths]
+
+    for rows, per_region in parts:
+        total_rows += rows
+        for region, counts in zip(REGIONS, per_region):
+            by_region[region].update(counts)
+
+    # the overall totals are the region totals added up (in C)
+    for counts in by_region.values():
+        overall.update(counts)
 
     return Summary(rows=total_rows, by_region=by_region, overall=overall)
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1024)
 def parse_ymd(s: str) -> date:
     """
     Accepts:
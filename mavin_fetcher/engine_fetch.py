@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .path_resolver import find_crop_b_root
+from .copy_engine import COPY_WORKERS, copy_data
+from .path_resolver import find_crop_b_root, find_model_drives
 from .scanner import scan
 
 LogFn = Optional[Callable[[str], None]]
@@ -41,6 +43,34 @@ def _detail_progress(fn: DetailProgressFn, done: int, total: int, class_name: st
         fn(done, total, class_name, filename)
 
 
+class _Throttled:
+    """
+    Forwards only the latest call to fn, at most every `batch` calls or `every` seconds.
+    The GUI marshals each callback into its event loop; per-file calls cost more than small copies.
+    """
+
+    def __init__(self, fn: Callable[..., None], every: float = 0.1, batch: int = 16) -> None:
+        self.fn = fn
+        self.every = every
+        self.batch = batch
+        self.last = time.monotonic()
+        self.count = 0
+        self.pending: Optional[tuple] = None
+
+    def __call__(self, *args) -> None:
+        self.pending = args
+        self.count += 1
+        if self.count >= self.batch or time.monotonic() - self.last >= self.every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pending is not None:
+            self.fn(*self.pending)
+            self.pending = None
+        self.count = 0
+        self.last = time.monotonic()
+
+
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
@@ -76,12 +106,15 @@ def fetch_images(
 
     _log(log, f"[INFO] Fetch days: {len(days)} | model={model} | include_activemap={include_activemap}")
 
+    # probe the drives once for the model folder, not once per day
+    model_drives = find_model_drives(model, drives)
+
     for day in days:
         if is_cancelled and is_cancelled():
             _log(log, "[WARN] Cancelled during pre-scan.")
             return FetchStats(0, 0, missing_days, 0, 0, {})
 
-        found = find_crop_b_root(model=model, day=day, drives=drives)
+        found = find_crop_b_root(model=model, day=day, drives=model_drives)
         if not found:
             _log(log, f"[WARN] Missing Crop_B folder for {day} (model={model})")
             missing_days += 1
@@ -106,46 +139,83 @@ def fetch_images(
     if include_activemap:
         _log(log, f"[INFO] ActiveMap included: {total_active_included} | missing pairs: {total_active_missing}")
 
-    # 2) Copy loop with per-file progress
+    # 2) Copy loop with per-file progress.
+    # Copies run on a thread pool (I/O bound, GIL released); results and callbacks stay on this thread.
     done = 0
     total_copied = 0
     total_overwritten = 0
     per_class_copied: Dict[str, int] = {}
 
     _progress(progress, 0, total_files)
-
-    for _, _, sr in scanned:
-        for class_name, files in sr.files_by_class.items():
-            if not files:
-                continue
-
-            dest_dir = out_dir / class_name
-            _ensure_dir(dest_dir)
-
-            for src in files:
-                if is_cancelled and is_cancelled():
-                    _log(log, "[WARN] Cancelled during copy.")
-                    _progress(progress, done, total_files)
-                    return FetchStats(
-                        total_copied,
-                        total_overwritten,
-                        missing_days,
-                        total_active_included,
-                        total_active_missing,
-                        per_class_copied,
-                    )
-
-                dst = dest_dir / src.name
-                if dst.exists():
-                    total_overwritten += 1
-
-                shutil.copy2(src, dst)
-                total_copied += 1
-                per_class_copied[class_name] = per_class_copied.get(class_name, 0) + 1
-
-                done += 1
-                _detail_progress(detail_progress, done, total_files, class_name, src.name)
-                _progress(progress, done, total_files)
+    throttled_progress = _Throttled(progress) if progress else None
+    throttled_detail = _Throttled(detail_progress) if detail_progress else None
+
+    def tasks() -> Iterator[Tuple[str, Path, Path]]:
+        for _, _, sr in scanned:
+            for class_name, files in sr.files_by_class.items():
+                if not files:
+                    continue
+
+                dest_dir = out_dir / class_name
+                _ensure_dir(dest_dir)
+
+                for src in files:
+                    yield class_name, src, dest_dir / src.name
+
+    def finish(fut: Future) -> None:
+        nonlocal done, total_copied, total_overwritten
+        class_name, name, dst = in_flight.pop(fut)
+        del busy[dst]
+        if fut.result():
+            total_overwritten += 1
+        total_copied += 1
+        per_class_copied[class_name] = per_class_copied.get(class_name, 0) + 1
+
+        done += 1
+        _detail_progress(throttled_detail, done, total_files, class_name, name)
+        _progress(throttled_progress, done, total_files)
+
+    cancelled = False
+    in_flight: Dict[Future, Tuple[str, str, Path]] = {}
+    busy: Dict[Path, Future] = {}  # dst -> its running copy
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        for class_name, src, dst in tasks():
+            if is_cancelled and is_cancelled():
+                cancelled = True
+                break
+            # same file name from another day: let the earlier copy land first, as before
+            if dst in busy:
+                wait([busy[dst]])
+                finish(busy[dst])
+            # a bounded window keeps cancel responsive (nothing far ahead is queued)
+            if len(in_flight) >= 2 * COPY_WORKERS:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    finish(fut)
+            fut = pool.submit(copy_data, src, dst)
+            in_flight[fut] = (class_name, src.name, dst)
+            busy[dst] = fut
+
+        for fut in as_completed(list(in_flight)):
+            finish(fut)
+
+    # the last file's callbacks always go out
+    if throttled_detail:
+        throttled_detail.flush()
+    if throttled_progress:
+        throttled_progress.flush()
+
+    if cancelled:
+        _log(log, "[WARN] Cancelled during copy.")
+        _progress(progress, done, total_files)
+        return FetchStats(
+            total_copied,
+            total_overwritten,
+            missing_days,
+            total_active_included,
+            total_active_missing,
+            per_class_copied,
+        )
 
     _log(log, f"[DONE] Copied {total_copied} files (overwrote {total_overwritten}). Missing days: {missing_days}")
     return FetchStats(
@@ -156,3 +226,27 @@ def fetch_images(
         total_active_missing,
         per_class_copied,
     )
+
+
+def fetch_images_queued(queue, cancel_event, **kwargs) -> None:
+    """
+    Runs fetch_images (keyword args as for fetch_images, minus the callbacks) with
+    every callback turned into a message on `queue`, for a caller in another process:
+      ("log", msg) | ("progress", done, total) | ("detail", done, total, class_name, filename)
+    followed by exactly one ("result", FetchStats) or ("error", message).
+    Setting `cancel_event` cancels the fetch.
+    Module-level (and Qt-free) so it can be the target of a child process.
+    """
+    put = queue.put
+    try:
+        stats = fetch_images(
+            **kwargs,
+            log=lambda msg: put(("log", msg)),
+            progress=lambda done, total: put(("progress", done, total)),
+            detail_progress=lambda done, total, class_name, filename: put(("detail", done, total, class_name, filename)),
+            is_cancelled=cancel_event.is_set,
+        )
+    except Exception as e:
+        put(("error", f"Error: {e}"))
+    else:
+        put(("result", stats))
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
 
@@ -12,9 +11,9 @@ class ParsedImageName:
     map_type: str            # "SourceMap" or "ActiveMap"
 
 
-def parse_image_filename(path: Path) -> Optional[ParsedImageName]:
+def parse_image_filename(name: str) -> Optional[ParsedImageName]:
     """
-    Parse filenames like:
+    Parse file names (the name only, not a path) like:
       l61SK02085_03-2_AN_083058_LOWER_2_B_L_..._SourceMap.jpg
       l61SK02085_03-2_AN_083058_UPPER_2_B_R_..._ActiveMap.jpg
 
@@ -23,7 +22,6 @@ def parse_image_filename(path: Path) -> Optional[ParsedImageName]:
       - extracts region using anchor tokens LOWER/UPPER + optional digit + B + L/R
       - cell_key is everything before LOWER/UPPER token
     """
-    name = path.name
     lower = name.lower()
     if not (lower.endswith(".jpg") or lower.endswith(".jpeg") or lower.endswith(".png")):
         return None
@@ -36,7 +34,8 @@ def parse_image_filename(path: Path) -> Optional[ParsedImageName]:
     else:
         return None
 
-    stem = path.stem  # drops extension
+    stem = name[:name.rfind(".")]  # drops extension (one of the suffixes checked above)
+
     parts = stem.split("_")
 
     # Find index of LOWER or UPPER
@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
+from typing import Iterable, List, Set
 
 from mavin_fetcher.view_index import OccurrenceItem
 from .types import Label, LabelAction
 from .pathing import dest_dir_for, ensure_dir
 
 
+def _move_overwrite(src: Path, dst: Path) -> None:
+    try:
+        # same volume: one rename that also replaces an existing dst
+        os.replace(src, dst)
+    except OSError:
+        # e.g. another drive: delete + copy/delete move, as before
+        if dst.exists():
+            dst.unlink()
+        shutil.move(str(src), str(dst))
+
+
+def _source_of(occurrence: OccurrenceItem) -> Path:
+    if not occurrence.source_path:
+        raise ValueError("Selected occurrence has no SourceMap file.")
+
+    src = Path(occurrence.source_path).expanduser().resolve()
+    if not src.exists():
+        raise FileNotFoundError(f"SourceMap file not found: {src}")
+    return src
+
+
 def apply_label(
     occurrence: OccurrenceItem,
     *,
@@ -20,33 +43,44 @@ def apply_label(
 
     Returns LabelAction that can be undone (move back).
     """
-    if not occurrence.source_path:
-        raise ValueError("Selected occurrence has no SourceMap file.")
+    return apply_label_batch([occurrence], label=label, human_root=human_root)[0]
 
-    src = Path(occurrence.source_path).expanduser().resolve()
-    if not src.exists():
-        raise FileNotFoundError(f"SourceMap file not found: {src}")
 
-    dest_dir = dest_dir_for(Path(human_root), occurrence.class_folder, label)
-    ensure_dir(dest_dir)
+def apply_label_batch(
+    occurrences: Iterable[OccurrenceItem],
+    *,
+    label: Label,
+    human_root: Path,
+) -> List[LabelAction]:
+    """
+    apply_label for many occurrences; actions are returned in input order.
+    Every occurrence is checked before anything moves, and each destination
+    folder is created once.
+    """
+    items = [(occ, _source_of(occ)) for occ in occurrences]
 
-    dst = dest_dir / src.name
+    actions: List[LabelAction] = []
+    made: Set[Path] = set()
+    for occ, src in items:
+        dest_dir = dest_dir_for(Path(human_root), occ.class_folder, label)
+        if dest_dir not in made:
+            ensure_dir(dest_dir)
+            made.add(dest_dir)
 
-    # Overwrite allowed
-    if dst.exists():
-        dst.unlink()
+        dst = dest_dir / src.name
 
-    # MOVE
-    shutil.move(str(src), str(dst))
+        # MOVE (overwrite allowed)
+        _move_overwrite(src, dst)
 
-    return LabelAction(
-        label=label,
-        class_folder=occurrence.class_folder,
-        cell_key=occurrence.cell_key,
-        region=occurrence.region,
-        src_path=src,     # original location
-        dst_path=dst,     # moved-to location
-    )
+        actions.append(LabelAction(
+            label=label,
+            class_folder=occ.class_folder,
+            cell_key=occ.cell_key,
+            region=occ.region,
+            src_path=src,     # original location
+            dst_path=dst,     # moved-to location
+        ))
+    return actions
 
 
 def undo(action: LabelAction) -> None:
@@ -64,7 +98,4 @@ def undo(action: LabelAction) -> None:
     # Ensure original directory exists
     src_back.parent.mkdir(parents=True, exist_ok=True)
 
-    if src_back.exists():
-        src_back.unlink()
-
-    shutil.move(str(moved), str(src_back))
+    _move_overwrite(moved, src_back)
@@ -2,14 +2,43 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 from .config import BASE_PARTS, PIPELINE_PARTS, FoundRoot
 from .date_utils import ymd_parts
 
 
-def find_crop_b_root(model: str, day: date, drives: Iterable[str]) -> Optional[FoundRoot]:
+def _drive_letter(drv: str) -> Optional[str]:
+    # Normalize drive input like "E", "E:", "E:\"
+    d = drv.strip().rstrip("\\/").rstrip(":").upper()
+    if len(d) != 1 or not d.isalpha():
+        return None
+    return d
+
+
+def _model_root(d: str, model: str) -> Path:
+    candidate = Path(f"{d}:/")
+    for p in BASE_PARTS:
+        candidate = candidate / p
+    return candidate / model
+
+
+def find_model_drives(model: str, drives: Iterable[str]) -> List[str]:
+    r"""
+    Returns the drives (in the given order) that have the model folder, e.g. E:\Files\Image\JF2.
+    Resolve this once per run: a drive without it can't hold any day, so
+    find_crop_b_root then skips absent drives instead of probing each per day.
     """
+    out: List[str] = []
+    for drv in drives:
+        d = _drive_letter(drv)
+        if d and d not in out and _model_root(d, model).is_dir():
+            out.append(d)
+    return out
+
+
+def find_crop_b_root(model: str, day: date, drives: Iterable[str]) -> Optional[FoundRoot]:
+    r"""
     Returns the first existing Crop_B folder found across given drives.
     Example:
       E:\Files\Image\JF2\2026\01\27\Mavin\Crop_B
@@ -17,16 +46,11 @@ def find_crop_b_root(model: str, day: date, drives: Iterable[str]) -> Optional[F
     yyyy, mm, dd = ymd_parts(day)
 
     for drv in drives:
-        # Normalize drive input like "E", "E:", "E:\"
-        d = drv.strip().rstrip("\\/").rstrip(":").upper()
-        if len(d) != 1 or not d.isalpha():
+        d = _drive_letter(drv)
+        if not d:
             continue
 
-        root = Path(f"{d}:/")
-        candidate = root
-        for p in BASE_PARTS:
-            candidate = candidate / p
-        candidate = candidate / model / yyyy / mm / dd
+        candidate = _model_root(d, model) / yyyy / mm / dd
         for p in PIPELINE_PARTS:
             candidate = candidate / p
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 from .config import EXCLUDED_CLASS_FOLDERS, SOURCEMAP_SUFFIX
 from .pairing import sourcemap_to_activemap_path
@@ -19,22 +20,36 @@ class ScanResult:
 
 
 def list_class_folders(crop_b_root: Path) -> List[Path]:
+    # DirEntry.is_dir() reuses the type info from the directory read instead of a stat per child
     out: List[Path] = []
-    for child in crop_b_root.iterdir():
-        if not child.is_dir():
-            continue
-        if child.name.lower() in EXCLUDED_CLASS_FOLDERS:
-            continue
-        out.append(child)
+    excluded = EXCLUDED_CLASS_FOLDERS
+    with os.scandir(crop_b_root) as it:
+        for e in it:
+            if e.name.lower() in excluded or not e.is_dir():
+                continue
+            out.append(Path(e.path))
     return sorted(out, key=lambda p: p.name.lower())
 
 
-def collect_sourcemaps(class_folder: Path) -> List[Path]:
+def _read_class_folder(class_folder: Path) -> Tuple[List[Path], Set[str]]:
+    """
+    One directory read of class_folder: (sorted SourceMap files, normcase'd names of all files).
+    The name set answers "does the paired ActiveMap exist" without a stat per SourceMap.
+    """
     files: List[Path] = []
-    for f in class_folder.iterdir():
-        if f.is_file() and f.name.endswith(SOURCEMAP_SUFFIX):
-            files.append(f)
-    return sorted(files, key=lambda p: p.name.lower())
+    names: Set[str] = set()
+    with os.scandir(class_folder) as it:
+        for e in it:
+            if not e.is_file():
+                continue
+            names.add(os.path.normcase(e.name))
+            if e.name.endswith(SOURCEMAP_SUFFIX):
+                files.append(Path(e.path))
+    return sorted(files, key=lambda p: p.name.lower()), names
+
+
+def collect_sourcemaps(class_folder: Path) -> List[Path]:
+    return _read_class_folder(class_folder)[0]
 
 
 def scan(crop_b_root: Path, include_activemap: bool) -> ScanResult:
@@ -47,7 +62,7 @@ def scan(crop_b_root: Path, include_activemap: bool) -> ScanResult:
     included_active = 0
 
     for class_dir in list_class_folders(crop_b_root):
-        srcs = collect_sourcemaps(class_dir)
+        srcs, file_names = _read_class_folder(class_dir)
         if not srcs:
             files_by_class[class_dir.name] = []
             continue
@@ -57,7 +72,8 @@ def scan(crop_b_root: Path, include_activemap: bool) -> ScanResult:
             out_files.append(src)
             if include_activemap:
                 active = sourcemap_to_activemap_path(src)
-                if active.exists() and active.is_file():
+                # normcase: matches like exists() did (case-insensitive on Windows)
+                if os.path.normcase(active.name) in file_names:
                     out_files.append(active)
                     included_active += 1
                 else:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -55,24 +56,32 @@ def build_view_index(out_dir: Path) -> ViewIndex:
     classes: Dict[str, List[OccurrenceItem]] = {}
     class_key_to_folder: Dict[str, str] = {}
 
-    if not out_dir.exists() or not out_dir.is_dir():
+    if not out_dir.is_dir():  # False for a missing path too
         return ViewIndex(out_dir=out_dir, classes={}, class_key_to_folder={})
 
-    # temp map: (folder, cell_key, region) -> OccurrenceItem
-    bucket: Dict[Tuple[str, str, str], OccurrenceItem] = {}
+    # scandir: DirEntry.is_dir() needs no extra stat on Windows; sorted like the Paths were
+    with os.scandir(out_dir) as it:
+        class_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: os.path.normcase(e.name))
 
-    for class_dir in sorted([p for p in out_dir.iterdir() if p.is_dir()]):
-        folder_name = class_dir.name
+    for class_entry in class_dirs:
+        folder_name = class_entry.name
         class_key = normalize_class_folder(folder_name)
         class_key_to_folder[class_key] = folder_name
 
-        for f in class_dir.glob("*.jpg"):
-            parsed = parse_image_filename(f)
+        # same match as glob("*.jpg"): normcase makes it case-insensitive only on Windows
+        with os.scandir(class_entry.path) as it:
+            jpg_names = [e.name for e in it if os.path.normcase(e.name).endswith(".jpg")]
+
+        # this folder's (cell_key, region) -> OccurrenceItem
+        per: Dict[Tuple[str, str], OccurrenceItem] = {}
+        for name in jpg_names:
+            parsed = parse_image_filename(name)
             if not parsed:
                 continue
+            f = Path(class_entry.path, name)  # only for files we keep
 
-            key = (folder_name, parsed.cell_key, parsed.region)
-            item = bucket.get(key)
+            key = (parsed.cell_key, parsed.region)
+            item = per.get(key)
             if not item:
                 item = OccurrenceItem(
                     class_folder=folder_name,
@@ -80,20 +89,16 @@ def build_view_index(out_dir: Path) -> ViewIndex:
                     cell_key=parsed.cell_key,
                     region=parsed.region,
                 )
-                bucket[key] = item
+                per[key] = item
 
             if parsed.map_type == "SourceMap":
                 item.source_path = f
             elif parsed.map_type == "ActiveMap":
                 item.active_path = f
 
-    # finalize classes dict
-    for (folder_name, _, _), item in bucket.items():
-        classes.setdefault(folder_name, []).append(item)
-
-    # sort each class list by cell_key then region
-    for folder_name in classes:
-        classes[folder_name].sort(key=lambda x: (x.cell_key, x.region))
+        # sorted by cell_key then region (the dict key)
+        if per:
+            classes[folder_name] = [per[k] for k in sorted(per)]
 
     return ViewIndex(out_dir=out_dir, classes=classes, class_key_to_folder=class_key_to_folder)
 
@@ -1,13 +1,89 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+import re
+from bisect import bisect_left
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from PyQt6.QtCore import Qt, QDate, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QDateEdit,
-    QPushButton, QListWidget, QListWidgetItem, QMessageBox
+    QPushButton, QListView, QMessageBox
 )
 
 
+# QDate <-> "yyyy-MM-dd" via the Julian day (a plain int), memoized:
+# the same few dates are formatted on every changed/export round-trip.
+@lru_cache(maxsize=4096)
+def _fmt_julian(jd: int) -> str:
+    return QDate.fromJulianDay(jd).toString("yyyy-MM-dd")
+
+
+_YMD_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# Julian day number of date.fromordinal(1) (0001-01-01) minus 1
+_JD_OFFSET = 1721425
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(s: str) -> Optional[int]:
+    # Parsed in Python (no QDate.fromString format parsing); None where Qt's "yyyy-MM-dd" would be invalid
+    m = _YMD_RE.fullmatch(s)
+    if not m:
+        return None
+    try:
+        return date(int(m[1]), int(m[2]), int(m[3])).toordinal() + _JD_OFFSET
+    except ValueError:
+        return None
+
+
+def _date_text(edit: QDateEdit) -> str:
+    return _fmt_julian(edit.date().toJulianDay())
+
+
+class DateListModel(QAbstractListModel):
+    """
+    Sorted, de-duplicated "YYYY-MM-DD" strings for the specific-dates list.
+    Bulk edits go through set_dates(): one model reset instead of per-item widget updates;
+    a single add is a bisect + one row insert.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dates: list[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._dates)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._dates[index.row()]
+        return None
+
+    def dates(self) -> list[str]:
+        return list(self._dates)
+
+    def set_dates(self, new: Iterable[str]) -> None:
+        self.beginResetModel()
+        self._dates = sorted({d.strip() for d in new})
+        self.endResetModel()
+
+    def insert_date(self, d: str) -> bool:
+        """Inserts d at its sorted position; False if it is already listed."""
+        i = bisect_left(self._dates, d)
+        if i < len(self._dates) and self._dates[i] == d:
+            return False
+        self.beginInsertRows(QModelIndex(), i, i)
+        self._dates.insert(i, d)
+        self.endInsertRows()
+        return True
+
+
+# quiet time after the last edit before changed is emitted
+CHANGED_DEBOUNCE_MS = 50
+
+
 class DateSelectorWidget(QWidget):
     """
     Date selection widget supporting:
@@ -55,13 +131,45 @@ class DateSelectorWidget(QWidget):
         self.single_row.addStretch(1)
         root.addLayout(self.single_row)
 
-        # Range
+        # Range and specific-dates rows are built on first use (_update_visible_rows);
+        # until then the range lives in _range_jd and the date list in the model.
         self.range_row = QHBoxLayout()
+        root.addLayout(self.range_row)
+        self.list_row = QVBoxLayout()
+        root.addLayout(self.list_row)
+
+        today = QDate.currentDate().toJulianDay()
+        self._range_jd = [today, today]
+        self._model = DateListModel(self)
+        self._built: set[str] = set()
+
+        # Bursts of edits (calendar navigation, typing a date) emit changed once
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(CHANGED_DEBOUNCE_MS)
+        # signal-to-signal: Qt forwards it without a Python slot in between
+        self._changed_timer.timeout.connect(self.changed)
+
+        # Wiring
+        self.mode.currentIndexChanged.connect(self._update_visible_rows)
+        self.mode.currentIndexChanged.connect(self._schedule_changed)
+
+        self.single_date.dateChanged.connect(self._schedule_changed)
+
+        # Widgets shown per mode, collected once (the layouts never change after a build)
+        self._widgets_single = self._layout_widgets(self.single_row)
+        self._widgets_range: list[QWidget] = []
+        self._widgets_specific: list[QWidget] = []
+
+        # Initialize visibility
+        self._update_visible_rows()
+
+    def _build_range(self) -> None:
         self.range_row.addWidget(QLabel("Start:"))
         self.range_start = QDateEdit()
         self.range_start.setCalendarPopup(True)
         self.range_start.setDisplayFormat("yyyy-MM-dd")
-        self.range_start.setDate(QDate.currentDate())
+        self.range_start.setDate(QDate.fromJulianDay(self._range_jd[0]))
 
         self.range_row.addWidget(self.range_start)
         self.range_row.addSpacing(12)
@@ -70,14 +178,18 @@ class DateSelectorWidget(QWidget):
         self.range_end = QDateEdit()
         self.range_end.setCalendarPopup(True)
         self.range_end.setDisplayFormat("yyyy-MM-dd")
-        self.range_end.setDate(QDate.currentDate())
+        self.range_end.setDate(QDate.fromJulianDay(self._range_jd[1]))
 
         self.range_row.addWidget(self.range_end)
         self.range_row.addStretch(1)
-        root.addLayout(self.range_row)
 
-        # Specific dates list
-        self.list_row = QVBoxLayout()
+        self.range_start.dateChanged.connect(self._schedule_changed)
+        self.range_end.dateChanged.connect(self._schedule_changed)
+
+        self._widgets_range = self._layout_widgets(self.range_row)
+        self._built.add("range")
+
+    def _build_specific(self) -> None:
         list_top = QHBoxLayout()
         list_top.addWidget(QLabel("Specific dates:"))
         list_top.addStretch(1)
@@ -99,28 +211,18 @@ class DateSelectorWidget(QWidget):
         self.specific_date_picker.setDate(QDate.currentDate())
         self.list_row.addWidget(self.specific_date_picker)
 
-        self.list_widget = QListWidget()
-        self.list_row.addWidget(self.list_widget)
-
-        root.addLayout(self.list_row)
-
-        # Wiring
-        self.mode.currentIndexChanged.connect(self._update_visible_rows)
-        self.mode.currentIndexChanged.connect(lambda: self.changed.emit())
-
-        self.single_date.dateChanged.connect(lambda: self.changed.emit())
-        self.range_start.dateChanged.connect(lambda: self.changed.emit())
-        self.range_end.dateChanged.connect(lambda: self.changed.emit())
-        self.specific_date_picker.dateChanged.connect(lambda: self.changed.emit())
+        self.list_view = QListView()
+        self.list_view.setModel(self._model)
+        self.list_row.addWidget(self.list_view)
 
+        self.specific_date_picker.dateChanged.connect(self._schedule_changed)
         self.add_btn.clicked.connect(self._on_add)
         self.remove_btn.clicked.connect(self._on_remove)
         self.clear_btn.clicked.connect(self._on_clear)
+        self.list_view.selectionModel().selectionChanged.connect(self._schedule_changed)
 
-        self.list_widget.itemSelectionChanged.connect(lambda: self.changed.emit())
-
-        # Initialize visibility
-        self._update_visible_rows()
+        self._widgets_specific = self._layout_widgets(self.list_row)
+        self._built.add("specific")
 
     def _update_visible_rows(self) -> None:
         mode = self.current_mode_text()
@@ -129,63 +231,97 @@ class DateSelectorWidget(QWidget):
         rng = (mode == "Date range")
         spec = (mode == "Specific dates")
 
-        # show/hide rows
-        self._set_layout_visible(self.single_row, single)
-        self._set_layout_visible(self.range_row, rng)
-        self._set_layout_visible(self.list_row, spec)
+        if rng and "range" not in self._built:
+            self._build_range()
+        if spec and "specific" not in self._built:
+            self._build_specific()
+
+        # show/hide rows; one repaint for the whole switch
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._widgets_single:
+                w.setVisible(single)
+            for w in self._widgets_range:
+                w.setVisible(rng)
+            for w in self._widgets_specific:
+                w.setVisible(spec)
+        finally:
+            self.setUpdatesEnabled(True)
 
-    def _set_layout_visible(self, layout, visible: bool) -> None:
-        # Works for QHBoxLayout/QVBoxLayout by toggling contained widgets
+    @staticmethod
+    def _layout_widgets(layout) -> list[QWidget]:
+        # Widgets of a QHBoxLayout/QVBoxLayout, nested layouts included
+        out: list[QWidget] = []
         for i in range(layout.count()):
             item = layout.itemAt(i)
             w = item.widget()
             if w is not None:
-                w.setVisible(visible)
+                out.append(w)
             else:
                 child_layout = item.layout()
                 if child_layout is not None:
-                    self._set_layout_visible(child_layout, visible)
+                    out.extend(DateSelectorWidget._layout_widgets(child_layout))
+        return out
+
+    def _schedule_changed(self, *_) -> None:
+        # (re)start the debounce window; signal arguments are ignored
+        self._changed_timer.start()
+
+    def flush(self) -> None:
+        """Emit a pending `changed` now instead of waiting for the debounce."""
+        if self._changed_timer.isActive():
+            self._changed_timer.stop()
+            self.changed.emit()
 
     def current_mode_text(self) -> str:
         return self.mode.currentText()
 
     def _on_add(self) -> None:
-        d = self.specific_date_picker.date().toString("yyyy-MM-dd")
-        existing = set(self._list_values())
-        if d in existing:
+        d = _date_text(self.specific_date_picker)
+        if not self._model.insert_date(d):
             QMessageBox.information(self, "Already added", f"{d} is already in the list.")
             return
-        self.list_widget.addItem(QListWidgetItem(d))
-        self._sort_list()
-        self.changed.emit()
+        self._schedule_changed()
 
     def _on_remove(self) -> None:
-        for it in self.list_widget.selectedItems():
-            row = self.list_widget.row(it)
-            self.list_widget.takeItem(row)
-        self.changed.emit()
+        rows = {ix.row() for ix in self.list_view.selectionModel().selectedRows()}
+        if rows:
+            vals = self._list_values()
+            self._model.set_dates(v for i, v in enumerate(vals) if i not in rows)
+        self._schedule_changed()
 
     def _on_clear(self) -> None:
-        self.list_widget.clear()
-        self.changed.emit()
+        self._model.set_dates([])
+        self._schedule_changed()
 
     def _list_values(self) -> list[str]:
-        return [self.list_widget.item(i).text().strip() for i in range(self.list_widget.count())]
-
-    def _sort_list(self) -> None:
-        vals = sorted(set(self._list_values()))
-        self.list_widget.clear()
-        for v in vals:
-            self.list_widget.addItem(QListWidgetItem(v))
+        # the model strips on the way in
+        return self._model.dates()
+
+    def _range_texts(self) -> tuple[str, str]:
+        if "range" in self._built:
+            return _date_text(self.range_start), _date_text(self.range_end)
+        return _fmt_julian(self._range_jd[0]), _fmt_julian(self._range_jd[1])
+
+    def _set_range_date(self, i: int, text: str) -> None:
+        jd = _parse_ymd(text)
+        if jd is None:
+            # QDateEdit ignores an invalid date; so do we
+            return
+        if "range" in self._built:
+            (self.range_start, self.range_end)[i].setDate(QDate.fromJulianDay(jd))
+        else:
+            self._range_jd[i] = jd
 
     def export_state(self) -> dict:
         mode = self.current_mode_text()
+        range_start, range_end = self._range_texts()
 
         state = {
             "date_mode": mode,
-            "single_date": self.single_date.date().toString("yyyy-MM-dd"),
-            "range_start": self.range_start.date().toString("yyyy-MM-dd"),
-            "range_end": self.range_end.date().toString("yyyy-MM-dd"),
+            "single_date": _date_text(self.single_date),
+            "range_start": range_start,
+            "range_end": range_end,
             "specific_dates": self._list_values(),
         }
         return state
@@ -207,23 +343,25 @@ class DateSelectorWidget(QWidget):
             rs = state.get("range_start", "") or ""
             re = state.get("range_end", "") or ""
 
-            if sd:
-                self.single_date.setDate(QDate.fromString(sd, "yyyy-MM-dd"))
+            jd = _parse_ymd(sd) if sd else None
+            if jd is not None:
+                self.single_date.setDate(QDate.fromJulianDay(jd))
             if rs:
-                self.range_start.setDate(QDate.fromString(rs, "yyyy-MM-dd"))
+                self._set_range_date(0, rs)
             if re:
-                self.range_end.setDate(QDate.fromString(re, "yyyy-MM-dd"))
+                self._set_range_date(1, re)
 
             dates = state.get("specific_dates", []) or []
-            self.list_widget.clear()
-            for d in sorted(set(dates)):
-                self.list_widget.addItem(QListWidgetItem(d))
+            self._model.set_dates(dates)
 
             self._update_visible_rows()
         finally:
             self.blockSignals(False)
 
-        # One clean notification
+        # Drop notifications queued by the child widgets during the import, then send
+        # one clean one. It stays synchronous: SessionPanel ignores it while applying a
+        # session (_updating_ui); a deferred emit would echo the state back to the session.
+        self._changed_timer.stop()
         self.changed.emit()
 
     def current_date_text(self) -> str:
@@ -236,8 +374,9 @@ class DateSelectorWidget(QWidget):
         """
         mode = self.current_mode_text()
         if mode == "Single date":
-            return self.single_date.date().toString("yyyy-MM-dd")
+            return _date_text(self.single_date)
         if mode == "Date range":
-            return f"{self.range_start.date().toString('yyyy-MM-dd')} {self.range_end.date().toString('yyyy-MM-dd')}"
+            start, end = self._range_texts()
+            return f"{start} {end}"
         # specific
         return ",".join(self._list_values())
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QCheckBox, QGroupBox
 )
 
 
-def allowed_drive_letters() -> list[str]:
-    return ["E", "F", "G"]
+_ALLOWED = ("E", "F", "G")
+_ALLOWED_SET = frozenset(_ALLOWED)
+# one bit per drive (E=1, F=2, G=4) for diffing checkbox states
+_BITS = {letter: 1 << i for i, letter in enumerate(_ALLOWED)}
+
+
+def allowed_drive_letters() -> tuple[str, ...]:
+    return _ALLOWED
+
+
+@lru_cache(maxsize=64)
+def _parse_drives_text(drives_text: str) -> frozenset[str]:
+    """
+    "E,f:, X" -> {"E", "F"}: the allowed letters named in drives_text.
+    Cached: the same few strings come back on every session apply.
+    """
+    parts = [x.strip().upper().rstrip(":") for x in drives_text.split(",") if x.strip()]
+    return frozenset(parts) & _ALLOWED_SET
 
 
 class DriveSelectorWidget(QWidget):
@@ -46,12 +64,23 @@ class DriveSelectorWidget(QWidget):
             cb.setChecked(checked)
 
     def set_letters(self, letters: list[str]) -> None:
-        allowed = set(allowed_drive_letters())
         target = {x.strip().upper().rstrip(":") for x in letters if x.strip()}
-        target = {x for x in target if x in allowed}
+        self._apply_mask(self._mask_of(target))
+
+    @staticmethod
+    def _mask_of(letters) -> int:
+        return sum(_BITS[x] for x in letters if x in _BITS)
 
+    def _apply_mask(self, want: int) -> None:
+        # only the boxes whose bit differs are touched; no change = no setChecked at all
+        have = self._mask_of(self.checked_letters())
+        diff = want ^ have
+        if not diff:
+            return
         for letter, cb in self._boxes.items():
-            cb.setChecked(letter in target)
+            bit = _BITS[letter]
+            if diff & bit:
+                cb.setChecked(bool(want & bit))
 
     def checked_letters(self) -> list[str]:
         return [letter for letter, cb in self._boxes.items() if cb.isChecked()]
@@ -61,8 +90,5 @@ class DriveSelectorWidget(QWidget):
 
     def from_text(self, drives_text: str) -> None:
         # ✅ empty means "none selected"
-        if not drives_text:
-            self.set_all(False)
-            return
-        parts = [x.strip().upper().rstrip(":") for x in drives_text.split(",") if x.strip()]
-        self.set_letters(parts)
+        target = _parse_drives_text(drives_text) if drives_text else frozenset()
+        self._apply_mask(self._mask_of(target))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QCheckBox,
@@ -69,6 +69,12 @@ class FetchTab(QWidget):
         self.log.setMinimumHeight(220)
         root.addWidget(self.log)
 
+        # the running worker's copy status is polled at 20 Hz instead of signalled per file
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._poll_status)
+        self._shown_status: tuple | None = None
+
         # signals
         self.run_btn.clicked.connect(self.on_run)
         self.cancel_btn.clicked.connect(self.on_cancel)
@@ -77,6 +83,8 @@ class FetchTab(QWidget):
         if self.worker and self.worker.isRunning():
             return
 
+        # date edits are debounced; run with the latest state
+        self.session_panel.flush()
         s = self.session.state
         days = s.to_days()
         if not days:
@@ -92,24 +100,23 @@ class FetchTab(QWidget):
             QMessageBox.warning(self, "Missing input", "Please choose an output folder in Session.")
             return
 
+        # Worker expects date_text; encode the session's dates the way its parser reads them
+        if s.date_mode == "Single date":
+            date_text = s.single_date
+        elif s.date_mode == "Date range":
+            date_text = f"{s.range_start} {s.range_end}"
+        else:
+            date_text = ",".join(s.specific_dates or [])
+
         cfg = FetchTaskConfig(
             date_mode=s.date_mode,
-            date_text="",  # not used by worker when we pass state-derived fields? (kept for compatibility)
+            date_text=date_text,
             out_dir=s.out_dir,
             model=s.model,
             drives_text=drives_text,
             include_activemap=self.include_active.isChecked(),
         )
 
-        # Worker expects date_text; simplest: encode state into date_text used by worker parser:
-        # We'll keep worker unchanged by providing what it expects:
-        if s.date_mode == "Single date":
-            cfg = FetchTaskConfig(s.date_mode, s.single_date, s.out_dir, s.model, drives_text, cfg.include_activemap)
-        elif s.date_mode == "Date range":
-            cfg = FetchTaskConfig(s.date_mode, f"{s.range_start} {s.range_end}", s.out_dir, s.model, drives_text, cfg.include_activemap)
-        else:
-            cfg = FetchTaskConfig(s.date_mode, ",".join(s.specific_dates or []), s.out_dir, s.model, drives_text, cfg.include_activemap)
-
         self.progress.setValue(0)
         self.progress_label.setText("Copied: 0 / 0")
         self.class_label.setText("Current class: -")
@@ -119,12 +126,19 @@ class FetchTab(QWidget):
         self.worker = FetchWorker(cfg)
         self.worker.progress_pct.connect(self.progress.setValue)
         self.worker.log.connect(self.log.append_line)
-        self.worker.status.connect(self.on_status)
         self.worker.done.connect(self.on_done)
 
         self.run_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
+        self._shown_status = None
         self.worker.start()
+        self._status_timer.start()
+
+    def _poll_status(self) -> None:
+        st = self.worker.latest_status() if self.worker else None
+        if st is not None and st != self._shown_status:
+            self._shown_status = st
+            self.on_status(*st)
 
     def on_status(self, done: int, total: int, class_name: str, filename: str) -> None:
         self.progress_label.setText(f"Copied: {done} / {total}")
@@ -136,6 +150,8 @@ class FetchTab(QWidget):
             self.worker.cancel()
 
     def on_done(self, success: bool, message: str) -> None:
+        self._status_timer.stop()
+        self._poll_status()  # the final count
         self.run_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         if success:
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import multiprocessing
+import queue
+import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from mavin_fetcher.date_utils import parse_ymd, date_range_inclusive, parse_dates_csv
-from mavin_fetcher.engine_fetch import fetch_images
+from mavin_fetcher.engine_fetch import fetch_images_queued
+
+# how long the worker thread waits for the fetch process before re-checking cancel
+DRAIN_INTERVAL_S = 0.05
+
+# "START END", "START to END", "START,END"
+_RANGE_SEP_RE = re.compile(r"[,\s]|to")
+
+
+def _parse_range(txt: str) -> list:
+    parts = [p for p in _RANGE_SEP_RE.split(txt) if p]
+    if len(parts) != 2:
+        raise ValueError("Date range must have exactly 2 dates: START END")
+    return date_range_inclusive(parse_ymd(parts[0]), parse_ymd(parts[1]))
+
+
+# date_mode -> parser of the stripped date_text
+_DAY_PARSERS = {
+    "Single date": lambda txt: [parse_ymd(txt)],
+    "Date range": _parse_range,
+    "Specific dates": parse_dates_csv,
+}
 
 
 @dataclass(frozen=True)
@@ -22,13 +47,16 @@ class FetchTaskConfig:
 class FetchWorker(QThread):
     progress_pct = pyqtSignal(int)             # 0..100
     log = pyqtSignal(str)
-    status = pyqtSignal(int, int, str, str)    # done, total, class_name, filename  <-- NEW
     done = pyqtSignal(bool, str)               # (success, message)
 
     def __init__(self, cfg: FetchTaskConfig):
         super().__init__()
         self.cfg = cfg
         self._cancel = False
+        self._last_pct = -1             # progress_pct only fires when the integer changes
+        # newest (done, total, class_name, filename); polled by the UI instead of a per-file signal
+        self._latest_status: tuple | None = None
+        self._status_lock = threading.Lock()
 
     def cancel(self) -> None:
         self._cancel = True
@@ -36,26 +64,91 @@ class FetchWorker(QThread):
     def _is_cancelled(self) -> bool:
         return self._cancel
 
+    def latest_status(self) -> tuple | None:
+        """Newest (done, total, class_name, filename), or None before the first copy."""
+        with self._status_lock:
+            return self._latest_status
+
     def _parse_drives(self) -> list[str]:
         parts = [x.strip() for x in (self.cfg.drives_text or "").split(",") if x.strip()]
         return parts if parts else ["E", "F", "G"]
 
     def _parse_days(self) -> list:
-        txt = (self.cfg.date_text or "").strip()
-        if self.cfg.date_mode == "Single date":
-            return [parse_ymd(txt)]
-
-        if self.cfg.date_mode == "Date range":
-            cleaned = txt.replace("to", " ").replace(",", " ")
-            parts = [p for p in cleaned.split() if p]
-            if len(parts) != 2:
-                raise ValueError("Date range must have exactly 2 dates: START END")
-            return date_range_inclusive(parse_ymd(parts[0]), parse_ymd(parts[1]))
-
-        if self.cfg.date_mode == "Specific dates":
-            return parse_dates_csv(txt)
-
-        raise ValueError(f"Unknown date mode: {self.cfg.date_mode}")
+        parser = _DAY_PARSERS.get(self.cfg.date_mode)
+        if parser is None:
+            raise ValueError(f"Unknown date mode: {self.cfg.date_mode}")
+        return parser((self.cfg.date_text or "").strip())
+
+    def _emit_batch(self, msgs: list) -> None:
+        """
+        Emits one drained batch of fetch_images_queued messages: log lines joined
+        into one log signal and the newest progress; the newest detail is stored
+        for latest_status().
+        """
+        lines: list[str] = []
+        progress = None
+        detail = None
+        for m in msgs:
+            kind = m[0]
+            if kind == "log":
+                lines.append(m[1])
+            elif kind == "progress":
+                progress = m[1:]
+            elif kind == "detail":
+                detail = m[1:]
+
+        if lines:
+            self.log.emit("\n".join(lines))
+        if progress is not None:
+            # (done,total) -> percent
+            done, total = progress
+            pct = 0 if total <= 0 else int(done * 100 / total)
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.progress_pct.emit(pct)
+        if detail is not None:
+            # detailed status for labels (Copied X/Y, class, filename)
+            with self._status_lock:
+                self._latest_status = detail
+
+    def _run_fetch_process(self, **kwargs):
+        """
+        Runs fetch_images in a child process and relays its messages from this thread,
+        one batch per wait, so the copy loop never touches the Qt binding.
+        Returns FetchStats; raises RuntimeError with the child's error message.
+        """
+        q = multiprocessing.Queue()
+        cancel_event = multiprocessing.Event()
+        proc = multiprocessing.Process(
+            target=fetch_images_queued, args=(q, cancel_event), kwargs=kwargs, daemon=True
+        )
+        proc.start()
+        try:
+            while True:
+                if self._cancel:
+                    cancel_event.set()
+                try:
+                    msgs = [q.get(timeout=DRAIN_INTERVAL_S)]
+                except queue.Empty:
+                    if not proc.is_alive() and q.empty():
+                        raise RuntimeError(f"Error: fetch process exited unexpectedly (code {proc.exitcode})")
+                    continue
+                while True:
+                    try:
+                        msgs.append(q.get_nowait())
+                    except queue.Empty:
+                        break
+
+                self._emit_batch(msgs)
+
+                last = msgs[-1]
+                if last[0] == "result":
+                    return last[1]
+                if last[0] == "error":
+                    raise RuntimeError(last[1])
+        finally:
+            cancel_event.set()
+            proc.join()
 
     def run(self) -> None:
         try:
@@ -64,28 +157,18 @@ class FetchWorker(QThread):
             model = (self.cfg.model or "JF2").strip()
             drives = self._parse_drives()
 
-            # existing: (done,total) -> percent
-            def on_progress(done: int, total: int) -> None:
-                if total <= 0:
-                    self.progress_pct.emit(0)
-                    return
-                self.progress_pct.emit(int(done * 100 / total))
-
-            # NEW: detailed status for labels (Copied X/Y, class, filename)
-            def on_detail(done: int, total: int, class_name: str, filename: str) -> None:
-                self.status.emit(done, total, class_name, filename)
-
-            stats = fetch_images(
-                days=days,
-                out_dir=out_dir,
-                model=model,
-                drives=drives,
-                include_activemap=bool(self.cfg.include_activemap),
-                log=self.log.emit,
-                progress=on_progress,
-                detail_progress=on_detail,     # <-- NEW (requires engine_fetch.py change)
-                is_cancelled=self._is_cancelled,
-            )
+            try:
+                stats = self._run_fetch_process(
+                    days=days,
+                    out_dir=out_dir,
+                    model=model,
+                    drives=drives,
+                    include_activemap=bool(self.cfg.include_activemap),
+                )
+            except RuntimeError as e:
+                # already formatted by the fetch process
+                self.done.emit(False, str(e))
+                return
 
             if self._cancel:
                 self.done.emit(False, "Cancelled.")
@@ -1,18 +1,68 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QLabel, QScrollArea, QWidget, QVBoxLayout
 
+# decoded images / scaled renders kept per preview (LRU)
+SOURCE_CACHE_SIZE = 16
+CACHE_SIZE = 8
+# viewport sizes are rounded down to this many px, so a drag-resize reuses renders
+SIZE_BUCKET = 16
+# during a drag-resize, renders are fast (nearest-neighbour); the smooth render
+# follows once no resize has arrived for this long
+SMOOTH_DELAY_MS = 120
+
+ImageKey = Tuple[str, int]  # (path, mtime_ns): an edited file is a new key
+
+
+def _lru_get(cache: OrderedDict, key):
+    pix = cache.get(key)
+    if pix is not None:
+        cache.move_to_end(key)
+    return pix
+
+
+def _lru_put(cache: OrderedDict, key, pix: QPixmap, maxsize: int = CACHE_SIZE) -> None:
+    cache[key] = pix
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _load_pixmap(path: Path) -> QPixmap:
+    """
+    Decodes from one bulk read of the file (null QPixmap if unreadable).
+    QPixmap(path) goes through QImageReader's small probing reads, each a round-trip on a network drive.
+    """
+    pix = QPixmap()
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return pix
+    pix.loadFromData(data)
+    return pix
+
 
 class ImagePreview(QWidget):
     def __init__(self):
         super().__init__()
         self._path: Optional[Path] = None
         self._pix: Optional[QPixmap] = None
+        self._key: Optional[ImageKey] = None
+        self._pixmaps: "OrderedDict[ImageKey, QPixmap]" = OrderedDict()
+        self._scaled: "OrderedDict[Tuple[ImageKey, int, int], QPixmap]" = OrderedDict()
+
+        self._resizing = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(SMOOTH_DELAY_MS)
+        self._resize_timer.timeout.connect(self._finalize_smooth)
 
         root = QVBoxLayout(self)
         self.label = QLabel("No image selected")
@@ -26,28 +76,56 @@ class ImagePreview(QWidget):
 
     def set_image(self, path: Optional[Path]) -> None:
         self._path = path
-        if not path or not path.exists():
+        try:
+            # one stat: existence check + mtime for the cache key
+            key = (str(path), path.stat().st_mtime_ns) if path else None
+        except OSError:
+            key = None
+        if key is None:
             self._pix = None
+            self._key = None
             self.label.setText("Image not found")
             return
 
-        pix = QPixmap(str(path))
-        if pix.isNull():
-            self._pix = None
-            self.label.setText("Failed to load image")
-            return
+        pix = _lru_get(self._pixmaps, key)
+        if pix is None:
+            pix = _load_pixmap(path)
+            if pix.isNull():
+                self._pix = None
+                self._key = None
+                self.label.setText("Failed to load image")
+                return
+            _lru_put(self._pixmaps, key, pix, SOURCE_CACHE_SIZE)
 
         self._pix = pix
+        self._key = key
         self._render_scaled()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
+        self._resizing = True
+        self._render_scaled()
+        # restarting the timer coalesces a drag into one smooth render at the end
+        self._resize_timer.start()
+
+    def _finalize_smooth(self) -> None:
+        self._resizing = False
         self._render_scaled()
 
     def _render_scaled(self) -> None:
-        if not self._pix:
+        if not self._pix or self._key is None:
             return
         w = max(10, self.scroll.viewport().width() - 10)
         h = max(10, self.scroll.viewport().height() - 10)
-        scaled = self._pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        w = max(10, w - w % SIZE_BUCKET)
+        h = max(10, h - h % SIZE_BUCKET)
+
+        cache_key = (self._key, w, h)
+        scaled = _lru_get(self._scaled, cache_key)
+        if scaled is None and self._resizing:
+            # mid-drag frame: cheap, not cached
+            scaled = self._pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+        elif scaled is None:
+            scaled = self._pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            _lru_put(self._scaled, cache_key, scaled)
         self.label.setPixmap(scaled)
@@ -1,13 +1,51 @@
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QTextEdit
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QPlainTextEdit
 
+# lines arriving within this window are appended (and scrolled to) once
+FLUSH_INTERVAL_MS = 100
 
-class LogWidget(QTextEdit):
+# oldest lines are dropped past this many
+MAX_LINES = 5000
+
+
+class LogWidget(QPlainTextEdit):
     def __init__(self):
         super().__init__()
         self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(MAX_LINES)
+
+        self._pending: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
 
     def append_line(self, text: str) -> None:
-        self.append(text)
-        self.ensureCursorVisible()
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        # one append = one relayout + scroll for the whole batch
+        self.appendPlainText(text)
+        bar = self.verticalScrollBar()
+        bar.setValue(bar.maximum())
+
+    def clear(self) -> None:
+        # lines queued before a clear belong to the cleared log
+        self._pending.clear()
+        self._flush_timer.stop()
+        super().clear()
+
+    def hideEvent(self, event) -> None:
+        # no timer wakeups while hidden; the queued lines go in now
+        self._flush()
+        super().hideEvent(event)
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import QMainWindow, QTabWidget
 from .fetch_tab import FetchTab
 from .summary_tab import SummaryTab
 from .viewer_tab import ViewerTab
-from .settings_store import load_settings, save_settings, Settings
+from .settings_store import load_settings, save_settings_async, Settings
 from .session_manager import SessionManager
 from .session_state import SessionState
 
@@ -69,7 +69,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event) -> None:
         merged = Settings.from_dict(self._settings.to_dict())
 
-        # session -> settings
+        # session -> settings (debounced date edits are pushed first)
+        self.fetch_tab.session_panel.flush()
+        self.summary_tab.session_panel.flush()
         s = self.session.state
         merged.model = s.model
         merged.out_dir = s.out_dir
@@ -95,5 +97,6 @@ class MainWindow(QMainWindow):
         except Exception:
             merged.window_geometry_b64 = ""
 
-        save_settings(merged)
+        # written off the UI thread; the window closes without waiting on the disk
+        save_settings_async(merged)
         super().closeEvent(event)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from dataclasses import replace
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from .session_state import SessionState
 
+# state changes within this window reach listeners as one `changed`
+CHANGED_DEBOUNCE_MS = 50
+
 
 class SessionManager(QObject):
     changed = pyqtSignal(object)  # emits SessionState
@@ -12,15 +17,29 @@ class SessionManager(QObject):
         super().__init__()
         self._state = initial or SessionState()
 
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(CHANGED_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_changed)
+
     @property
     def state(self) -> SessionState:
         return self._state
 
     def set_state(self, s: SessionState) -> None:
+        # `state` is current immediately; listeners get the latest one once edits settle
         self._state = s
-        self.changed.emit(self._state)
+        self._emit_timer.start()
 
     def update(self, **kwargs) -> None:
         # Create a new state object (keeps it predictable)
-        s = SessionState(**{**self._state.__dict__, **kwargs})
-        self.set_state(s)
+        self.set_state(replace(self._state, **kwargs))
+
+    def flush(self) -> None:
+        """Emit a pending `changed` now instead of waiting for the debounce."""
+        if self._emit_timer.isActive():
+            self._emit_changed()
+
+    def _emit_changed(self) -> None:
+        self._emit_timer.stop()
+        self.changed.emit(self._state)
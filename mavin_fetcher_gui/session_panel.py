@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QWidget, QGroupBox, QFormLayout, QHBoxLayout,
     QLineEdit, QPushButton, QVBoxLayout
@@ -13,6 +14,9 @@ from .session_manager import SessionManager
 from .session_state import SessionState
 from .output_defaults import suggest_output_dir
 
+# date edits within this window cost one default-output + session update
+DATES_DEBOUNCE_MS = 150
+
 
 class SessionPanel(QWidget):
     """
@@ -31,6 +35,8 @@ class SessionPanel(QWidget):
         super().__init__()
         self.session = session
         self._updating_ui = False
+        # last state this panel pushed; its (debounced) echo is not applied back
+        self._pushed: SessionState | None = None
 
         box = QGroupBox("Session (shared)")
         form = QFormLayout(box)
@@ -72,6 +78,10 @@ class SessionPanel(QWidget):
         self.csv_dir.editingFinished.connect(self._push_to_session)
 
         # Date selector emits changed
+        self._dates_timer = QTimer(self)
+        self._dates_timer.setSingleShot(True)
+        self._dates_timer.setInterval(DATES_DEBOUNCE_MS)
+        self._dates_timer.timeout.connect(self._apply_dates_now)
         self.date_selector.changed.connect(self._on_dates_changed)
 
         # listen to session changes (so both tabs stay in sync)
@@ -84,6 +94,20 @@ class SessionPanel(QWidget):
         self._maybe_apply_default_output()
 
     def _on_dates_changed(self) -> None:
+        # changes made by apply_session come from the session; don't echo them back
+        if self._updating_ui:
+            return
+        self._dates_timer.start()
+
+    def flush(self) -> None:
+        """Push any debounced date edit to the session and emit its change now."""
+        self.date_selector.flush()
+        if self._dates_timer.isActive():
+            self._dates_timer.stop()
+            self._apply_dates_now()
+        self.session.flush()
+
+    def _apply_dates_now(self) -> None:
         # If user hasn't chosen output, update default output path based on dates
         self._maybe_apply_default_output()
         self._push_to_session()
@@ -155,9 +179,14 @@ class SessionPanel(QWidget):
             range_end=ds.get("range_end", ""),
             specific_dates=ds.get("specific_dates", []) or [],
         )
+        self._pushed = s
         self.session.set_state(s)
 
     def apply_session(self, s: SessionState) -> None:
+        # `changed` arrives after the debounce; by then the user may have typed on, and
+        # re-applying our own push would revert those edits
+        if s is self._pushed:
+            return
         self._updating_ui = True
         try:
             self.model_edit.setText(s.model or "JF2")
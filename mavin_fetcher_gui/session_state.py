@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from mavin_fetcher.date_utils import parse_ymd, date_range_inclusive, parse_dates_csv
 
@@ -23,20 +24,31 @@ class SessionState:
     specific_dates: List[str] = field(default_factory=list)
 
     def to_days(self) -> List[date]:
-        mode = (self.date_mode or "Single date").strip()
-
-        if mode == "Single date":
-            if not self.single_date:
-                return []
-            return [parse_ymd(self.single_date)]
-
-        if mode == "Date range":
-            if not self.range_start or not self.range_end:
-                return []
-            return date_range_inclusive(parse_ymd(self.range_start), parse_ymd(self.range_end))
-
-        if mode == "Specific dates":
-            txt = ",".join(self.specific_dates or [])
-            return parse_dates_csv(txt)
-
-        return []
+        # fresh list per call; the parsed days are shared per date selection
+        return list(_days_for(
+            self.date_mode, self.single_date, self.range_start, self.range_end,
+            tuple(self.specific_dates or ()),
+        ))
+
+
+@lru_cache(maxsize=64)
+def _days_for(
+    date_mode: str, single_date: str, range_start: str, range_end: str, specific_dates: Tuple[str, ...]
+) -> Tuple[date, ...]:
+    mode = (date_mode or "Single date").strip()
+
+    if mode == "Single date":
+        if not single_date:
+            return ()
+        return (parse_ymd(single_date),)
+
+    if mode == "Date range":
+        if not range_start or not range_end:
+            return ()
+        return tuple(date_range_inclusive(parse_ymd(range_start), parse_ymd(range_end)))
+
+    if mode == "Specific dates":
+        txt = ",".join(specific_dates)
+        return tuple(parse_dates_csv(txt))
+
+    return ()
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json writes the same file
+    orjson = None
+
 
 SETTINGS_FILE = Path(__file__).resolve().parent / "settings.json"
 
+# bytes last read from / written to SETTINGS_FILE; identical saves are skipped
+_last_payload: bytes | None = None
+
+# ((st_mtime_ns, st_size), parsed dict) of the last settings.json read
+_load_cache: tuple[tuple[int, int], dict] | None = None
+
+# background save: only the newest queued Settings is written
+_save_lock = threading.Lock()
+_save_pending: Settings | None = None
+_save_thread: threading.Thread | None = None
+
 
 @dataclass
 class Settings:
@@ -61,15 +79,68 @@ class Settings:
 
 
 def load_settings() -> Settings:
+    global _last_payload, _load_cache
     try:
-        if SETTINGS_FILE.exists():
-            data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                return Settings.from_dict(data)
+        st = SETTINGS_FILE.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _load_cache is not None and _load_cache[0] == key:
+            return Settings.from_dict(_load_cache[1])
+
+        raw = SETTINGS_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, dict):
+            _last_payload = raw
+            _load_cache = (key, data)
+            return Settings.from_dict(data)
     except Exception:
         pass
     return Settings()
 
 
 def save_settings(s: Settings) -> None:
-    SETTINGS_FILE.write_text(json.dumps(s.to_dict(), indent=2), encoding="utf-8")
+    global _last_payload
+    if orjson is not None:
+        payload = orjson.dumps(s.to_dict(), option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(s.to_dict(), indent=2).encode("utf-8")
+    if payload == _last_payload and SETTINGS_FILE.exists():
+        return
+
+    # write a sibling and swap it in, so an interrupted save never leaves a truncated file
+    tmp = SETTINGS_FILE.with_suffix(".json.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, SETTINGS_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _last_payload = payload
+
+
+def save_settings_async(s: Settings) -> None:
+    """Queue a save on a background thread and return immediately.
+
+    Saves queued while one is being written collapse into the newest. The thread is
+    not a daemon, so the interpreter finishes the write before the process exits.
+    """
+    global _save_pending, _save_thread
+    with _save_lock:
+        _save_pending = s
+        if _save_thread is None:
+            _save_thread = threading.Thread(target=_save_loop, name="settings-save")
+            _save_thread.start()
+
+
+def _save_loop() -> None:
+    global _save_pending, _save_thread
+    while True:
+        with _save_lock:
+            s = _save_pending
+            _save_pending = None
+            if s is None:
+                _save_thread = None
+                return
+        try:
+            save_settings(s)
+        except Exception:
+            pass
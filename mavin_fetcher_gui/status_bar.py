@@ -3,6 +3,14 @@ from __future__ import annotations
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QLabel
 
+# parsed once per label; variants are picked by the "state" property
+_STYLE = (
+    "QLabel { padding: 6px; border-radius: 6px; }"
+    "QLabel[state='success'] { background: #E8F5E9; }"
+    "QLabel[state='info'] { background: #E3F2FD; }"
+    "QLabel[state='error'] { background: #FFEBEE; }"
+)
+
 
 class StatusBarLabel(QLabel):
     """
@@ -15,7 +23,8 @@ class StatusBarLabel(QLabel):
         self._clear_ms = int(clear_ms)
         self.setWordWrap(True)
         self.setMinimumHeight(18)
-        self.setStyleSheet("padding: 6px; border-radius: 6px;")
+        self.setStyleSheet(_STYLE)
+        self._state = ""
 
         self._timer = QTimer(self)
         self._timer.setSingleShot(True)
@@ -29,18 +38,23 @@ class StatusBarLabel(QLabel):
         # hidden when empty so layout stays clean
         self.setVisible(False)
 
-    def _show(self, text: str, css: str) -> None:
+    def _show(self, text: str, state: str) -> None:
         self._timer.stop()
         self.setVisible(True)
         self.setText(text)
-        self.setStyleSheet(css)
+        if state != self._state:
+            # re-evaluate the property selectors without re-parsing the sheet
+            self._state = state
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
         self._timer.start(self._clear_ms)
 
     def set_success(self, text: str) -> None:
-        self._show(text, "padding: 6px; border-radius: 6px; background: #E8F5E9;")
+        self._show(text, "success")
 
     def set_info(self, text: str) -> None:
-        self._show(text, "padding: 6px; border-radius: 6px; background: #E3F2FD;")
+        self._show(text, "info")
 
     def set_error(self, text: str) -> None:
-        self._show(text, "padding: 6px; border-radius: 6px; background: #FFEBEE;")
+        self._show(text, "error")
@@ -92,6 +92,8 @@ class SummaryTab(QWidget):
             self.csv_paths.setText(";".join(picked))
 
     def on_auto_find(self) -> None:
+        # date edits are debounced; search with the latest state
+        self.session_panel.flush()
         s = self.session.state
         days = s.to_days()
         if not days:
@@ -1,41 +1,122 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
+from typing import List, Tuple
 
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtWidgets import QTableView
 
-class SummaryTableWidget(QTableWidget):
+_ALIGN_TEXT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+_ALIGN_NUM = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight
+
+
+class SummaryModel(QAbstractTableModel):
+    """
+    Class summary as plain columns: one list of class names and one tuple of counts
+    per row (cells, occurrences, then one count per region). Cells are formatted on
+    demand instead of being stored as item objects.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._classes: List[str] = []
+        self._numeric: List[Tuple[int, ...]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._classes)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._classes[row]
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return _ALIGN_TEXT
+            return None
+
+        value = self._numeric[row][col - 1]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(value)
+        if role == Qt.ItemDataRole.UserRole:
+            return float(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _ALIGN_NUM
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        if not self._classes or not 0 <= column < len(self._headers):
+            return
+        if column == 0:
+            key = self._classes.__getitem__
+        else:
+            key = lambda r: self._numeric[r][column - 1]
+        perm = sorted(
+            range(len(self._classes)), key=key,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self.layoutAboutToBeChanged.emit()
+        self._classes = [self._classes[r] for r in perm]
+        self._numeric = [self._numeric[r] for r in perm]
+
+        # selection / current index follow their rows: old row perm[i] is now row i
+        new_row = [0] * len(perm)
+        for i, r in enumerate(perm):
+            new_row[r] = i
+        old = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old, [self.index(new_row[ix.row()], ix.column()) for ix in old]
+        )
+        self.layoutChanged.emit()
+
+    def set_rows(self, headers: List[str], classes: List[str], numeric: List[Tuple[int, ...]]) -> None:
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._classes = classes
+        self._numeric = numeric
+        self.endResetModel()
+
+    def class_at(self, row: int) -> str:
+        return self._classes[row] if 0 <= row < len(self._classes) else ""
+
+
+class SummaryTableWidget(QTableView):
     class_selected = pyqtSignal(str)  # emits normalized class key like NG_CRITICAL
 
     def __init__(self):
         super().__init__()
+        self._model = SummaryModel(self)
+        self.setModel(self._model)
         self.setSortingEnabled(True)
 
-        self.cellDoubleClicked.connect(self._on_double_click)
+        self.doubleClicked.connect(self._on_double_click)
 
-    def _on_double_click(self, row: int, col: int) -> None:
+    def _on_double_click(self, index: QModelIndex) -> None:
         # Class column is 0
-        it = self.item(row, 0)
-        if not it:
-            return
-        cls = it.text().strip()
+        cls = self._model.class_at(index.row()).strip()
         if cls:
             self.class_selected.emit(cls)
 
     def set_summary_data(self, data: dict) -> None:
         self.setSortingEnabled(False)
-        self.clear()
 
         if not data or "classes" not in data:
-            self.setRowCount(0)
-            self.setColumnCount(0)
+            self._model.set_rows([], [], [])
             self.setSortingEnabled(True)
             return
 
         regions = data.get("regions", [])
         headers = ["Class", "Cells", "Occurrences"] + regions
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
 
         classes = data["classes"]  # dict
         rows = []
@@ -47,23 +128,19 @@ class SummaryTableWidget(QTableWidget):
 
         rows.sort(key=lambda x: x[1], reverse=True)
 
-        self.setRowCount(len(rows))
-
-        for r, (cls, cells, occ, by_region) in enumerate(rows):
-            self._set_item(r, 0, cls, is_num=False)
-            self._set_item(r, 1, cells, is_num=True)
-            self._set_item(r, 2, occ, is_num=True)
-            for c, region in enumerate(regions, start=3):
-                self._set_item(r, c, int(by_region.get(region, 0)), is_num=True)
+        # fill only the regions a class actually has; the rest stay 0
+        region_idx = {region: i for i, region in enumerate(regions)}
+        names = []
+        numeric = []
+        for cls, cells, occ, by_region in rows:
+            counts = [0] * len(regions)
+            for region, n in by_region.items():
+                i = region_idx.get(region)
+                if i is not None:
+                    counts[i] = int(n)
+            names.append(str(cls))
+            numeric.append((cells, occ, *counts))
+        self._model.set_rows(headers, names, numeric)
 
         self.resizeColumnsToContents()
         self.setSortingEnabled(True)
-
-    def _set_item(self, row: int, col: int, value, *, is_num: bool) -> None:
-        it = QTableWidgetItem(str(value))
-        if is_num:
-            it.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-            it.setData(Qt.ItemDataRole.UserRole, float(value))
-        else:
-            it.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        self.setItem(row, col, it)
@@ -5,4 +5,7 @@ def main() -> None:
     raise SystemExit(gui_main())
 
 if __name__ == "__main__":
+    # The fetch and the B-area summary run in child processes; in the frozen exe they re-enter here.
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()